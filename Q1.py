@@ -1,17 +1,81 @@
-import time
+import math
+import mmap
+import struct
+from array import array
 
 class Node:
+    #no per-node __dict__: roughly halves the footprint of a 1M-node list
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
-class LinkedList:
+class OpStats:
+    """
+    Algorithmic cost counters for the list classes, kept per operation
+    name: calls, node hops (next/prev links followed), element shifts in
+    the auxiliary index and node allocations. Lists only record while
+    `stats` is set, so disabled instrumentation costs one None check per
+    operation and nothing inside the traversal loops.
+    """
+    FIELDS = ("calls", "hops", "shifts", "allocs")
+
+    def __init__(self):
+        self.ops = {}
+
+    def record(self, op, hops=0, shifts=0, allocs=0):
+        counts = self.ops.get(op)
+        if counts is None:
+            counts = self.ops[op] = [0, 0, 0, 0]
+        counts[0] += 1
+        counts[1] += hops
+        counts[2] += shifts
+        counts[3] += allocs
+
+    def get(self, op):
+        return dict(zip(self.FIELDS, self.ops.get(op, [0, 0, 0, 0])))
+
+    def totals(self):
+        totals = [0, 0, 0, 0]
+        for counts in self.ops.values():
+            for i in range(4):
+                totals[i] += counts[i]
+        return dict(zip(self.FIELDS, totals))
+
+    def reset(self):
+        self.ops = {}
+
+    def printAll(self):
+        print(f"{'Operation':<12} {'Calls':>10} {'Hops':>12} {'Shifts':>12} {'Allocs':>10}")
+        for op, (calls, hops, shifts, allocs) in self.ops.items():
+            print(f"{op:<12} {calls:>10} {hops:>12} {shifts:>12} {allocs:>10}")
+
+
+class Instrumented:
+    #instrumentation is off until enable_stats() attaches an OpStats
+    stats = None
+
+    def enable_stats(self):
+        self.stats = OpStats()
+        return self.stats
+
+    def disable_stats(self):
+        stats, self.stats = self.stats, None
+        return stats
+
+
+class LinkedList(Instrumented):
     def __init__(self):
         self.head = None
         self.tail = None
+        #(position, node) of the last node reached by a walk
+        self.finger = None
 
     #for testing 
     def append(self, value):
+            if self.stats is not None:
+                self.stats.record("append", allocs=1)
             newNode = Node(value)
             if self.head is None:
                 self.head = self.tail = newNode
@@ -19,32 +83,64 @@ class LinkedList:
                 self.tail.next = newNode
                 self.tail = newNode
 
-    #Worst case: O(n)
-    def get(self, position):
+    #Resumes from the finger when the target is at or after it, so sequential
+    #and nearby forward accesses are O(1) amortized instead of O(n) each
+    def _walk(self, position):
+        #negative positions stay at the head and are never saved as the finger
+        if position < 0:
+            return self.head
+        if self.finger is not None and self.finger[0] <= position:
+            start, currNode = self.finger
+        else:
+            start, currNode = 0, self.head
+        for i in range(position - start):
+            currNode = currNode.next
+        self.finger = (position, currNode)
+        return currNode
+
+    #hops the next _walk(position) will take
+    def _walk_cost(self, position):
+        if position < 0:
+            return 0
+        if self.finger is not None and self.finger[0] <= position:
+            return position - self.finger[0]
+        return position
+
+    def __iter__(self):
         currNode = self.head
-        for i in range(position):
+        while currNode is not None:
+            yield currNode.data
             currNode = currNode.next
-        return currNode.data
+
+    def cursor(self, position=0):
+        return LinkedListCursor(self, position)
 
     #Worst case: O(n)
+    def get(self, position):
+        if self.stats is not None:
+            self.stats.record("get", hops=self._walk_cost(position))
+        return self._walk(position).data
+
+    #Worst case: O(n)
+    #inserting after `position` leaves the finger at `position` valid
     def insert(self, position, value):
+        if self.stats is not None:
+            self.stats.record("insert", hops=self._walk_cost(position), allocs=1)
         newNode = Node(value)
-        start_time = time.process_time()
-        currNode = self.head
-        for i in range(position):
-            currNode = currNode.next
+        currNode = self._walk(position)
         newNode.next = currNode.next
         currNode.next = newNode
-        end_time = time.process_time()
-        time_taken = end_time-start_time
-        return time_taken
+        if currNode is self.tail:
+            self.tail = newNode
 
     #Worst case: O(n)
     def delete(self, position):
-        currNode = self.head
-        for i in range(position):
-            currNode = currNode.next
+        if self.stats is not None:
+            self.stats.record("delete", hops=self._walk_cost(position))
+        currNode = self._walk(position)
         currNode.next = currNode.next.next
+        if currNode.next is None:
+            self.tail = currNode
 
     def printAll(self):
         if self.head != None:
@@ -55,14 +151,421 @@ class LinkedList:
             print(currNode.data)
 
 
-class ModifiedLinkedList:
+class DNode:
+    __slots__ = ("data", "prev", "next")
+
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+class DoublyLinkedList(Instrumented):
+    """
+    Doubly linked list whose walks start from whichever end is nearer, so
+    get/insert/delete traverse at most n/2 nodes. Positions follow
+    ModifiedLinkedList: insert(i, v) makes v the node at index i.
+    """
+
     def __init__(self):
         self.head = None
         self.tail = None
-        self.array = []
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        currNode = self.head
+        while currNode is not None:
+            yield currNode.data
+            currNode = currNode.next
+
+    #for testing
+    def append(self, value):
+        if self.stats is not None:
+            self.stats.record("append", allocs=1)
+        newNode = DNode(value)
+        if self.head is None:
+            self.head = self.tail = newNode
+        else:
+            newNode.prev = self.tail
+            self.tail.next = newNode
+            self.tail = newNode
+        self.size += 1
+
+    #Worst case: O(n/2)
+    def _walk(self, position):
+        if position < self.size // 2:
+            currNode = self.head
+            for i in range(position):
+                currNode = currNode.next
+        else:
+            currNode = self.tail
+            for i in range(self.size - 1 - position):
+                currNode = currNode.prev
+        return currNode
+
+    def _walk_cost(self, position):
+        return min(position, self.size - 1 - position)
+
+    #Worst case: O(n/2)
+    def get(self, position):
+        if position < 0 or position >= self.size:
+            print("Position out of bounds")
+        else:
+            if self.stats is not None:
+                self.stats.record("get", hops=self._walk_cost(position))
+            return self._walk(position).data
+
+    #Worst case: O(n/2)
+    def insert(self, position, value):
+        if position < 0 or position > self.size:
+            print("Position out of bounds")
+        elif position == self.size:
+            self.append(value)
+        else:
+            if self.stats is not None:
+                self.stats.record("insert", hops=self._walk_cost(position), allocs=1)
+            newNode = DNode(value)
+            nextNode = self._walk(position)
+            prevNode = nextNode.prev
+            newNode.prev = prevNode
+            newNode.next = nextNode
+            nextNode.prev = newNode
+            if prevNode is None:
+                self.head = newNode
+            else:
+                prevNode.next = newNode
+            self.size += 1
+
+    #Worst case: O(n/2)
+    def delete(self, position):
+        if position < 0 or position >= self.size:
+            print("Position out of bounds")
+            return
+        if self.stats is not None:
+            self.stats.record("delete", hops=self._walk_cost(position))
+        targetNode = self._walk(position)
+        if targetNode.prev is None:
+            self.head = targetNode.next
+        else:
+            targetNode.prev.next = targetNode.next
+        if targetNode.next is None:
+            self.tail = targetNode.prev
+        else:
+            targetNode.next.prev = targetNode.prev
+        self.size -= 1
+
+    def printAll(self):
+        currNode = self.head
+        while currNode:
+            print(currNode.data, end=" -> " if currNode.next else "")
+            currNode = currNode.next
+        print()
+
+
+class LinkedListCursor:
+    """
+    Movable position in a LinkedList. Moving forward and editing next to
+    the cursor cost O(distance moved), so a scan or a run of nearby edits
+    is O(1) amortized per step. Like LinkedList.insert/delete, edits act on
+    the node after the cursor. A cursor is invalidated by edits made
+    through the list or another cursor at or before its position.
+    """
+
+    def __init__(self, linkedList, position=0):
+        self.list = linkedList
+        self.position = position
+        self.node = linkedList._walk(position)
+
+    def get(self):
+        return self.node.data
+
+    def move(self, position):
+        if position >= self.position:
+            for i in range(position - self.position):
+                self.node = self.node.next
+        else:
+            #singly linked: moving back restarts from the list's finger or head
+            self.node = self.list._walk(position)
+        self.position = position
+
+    #advances one node; returns False when already at the tail
+    def next(self):
+        if self.node.next is None:
+            return False
+        self.node = self.node.next
+        self.position += 1
+        return True
+
+    def _edited(self):
+        #positions after the cursor shifted, so pull the list finger back
+        finger = self.list.finger
+        if finger is not None and finger[0] > self.position:
+            self.list.finger = (self.position, self.node)
+
+    def insert(self, value):
+        newNode = Node(value)
+        newNode.next = self.node.next
+        self.node.next = newNode
+        if self.node is self.list.tail:
+            self.list.tail = newNode
+        self._edited()
+
+    def delete(self):
+        self.node.next = self.node.next.next
+        if self.node.next is None:
+            self.list.tail = self.node
+        self._edited()
+
+
+class BlockedIndex:
+    """
+    Rope-style positional index used as the auxiliary array of
+    ModifiedLinkedList. Pointers are kept in blocks of roughly `load`
+    entries and a Fenwick tree over the block lengths locates the block
+    holding any position, so positional insert/pop only shift one block.
+
+    get: O(log(n/load)), insert/pop: O(load + log(n/load)) amortized.
+    """
+
+    def __init__(self, items=(), load=1000):
+        self.load = load
+        self._rebuild(list(items))
+
+    def _rebuild(self, items):
+        load = self.load
+        self.blocks = [items[i:i + load] for i in range(0, len(items), load)]
+        self.length = len(items)
+        self._build_tree()
+
+    #O(m) Fenwick construction over the m block lengths
+    def _build_tree(self):
+        tree = [0] + [len(block) for block in self.blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _tree_add(self, block, delta):
+        tree = self.tree
+        i = block + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, block):
+        #number of entries stored in blocks[0:block]
+        total = 0
+        while block:
+            total += self.tree[block]
+            block -= block & -block
+        return total
+
+    #Fenwick descent: returns (block, offset) of a position in O(log m)
+    def _locate(self, position):
+        tree = self.tree
+        block = 0
+        bit = 1 << (len(tree) - 1).bit_length()
+        while bit:
+            nxt = block + bit
+            if nxt < len(tree) and tree[nxt] <= position:
+                block = nxt
+                position -= tree[nxt]
+            bit >>= 1
+        return block, position
+
+    def __len__(self):
+        return self.length
+
+    #entries moved by an insert/pop at `position`: the rest of its block
+    def shift_cost(self, position):
+        if position >= self.length:
+            return 0
+        block, offset = self._locate(position)
+        return len(self.blocks[block]) - offset
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self.length
+        if position < 0 or position >= self.length:
+            raise IndexError("BlockedIndex index out of range")
+        block, offset = self._locate(position)
+        return self.blocks[block][offset]
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            #slice assignment re-blocks the whole index in one O(n + k) pass
+            items = list(self)
+            items[key] = value
+            self._rebuild(items)
+        else:
+            if key < 0:
+                key += self.length
+            block, offset = self._locate(key)
+            self.blocks[block][offset] = value
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            items = list(self)
+            del items[key]
+            self._rebuild(items)
+        else:
+            self.pop(key)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def append(self, item):
+        blocks = self.blocks
+        if blocks and len(blocks[-1]) < self.load:
+            blocks[-1].append(item)
+            self._tree_add(len(blocks) - 1, 1)
+        else:
+            #grow the Fenwick tree by one node without a full rebuild
+            blocks.append([item])
+            i = len(blocks)
+            self.tree.append(1 + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        self.length += 1
+
+    def insert(self, position, item):
+        if position >= self.length:
+            self.append(item)
+            return
+        block, offset = self._locate(max(position, 0))
+        self.blocks[block].insert(offset, item)
+        self.length += 1
+        if len(self.blocks[block]) > 2 * self.load:
+            #split an overfull block in half, then re-index the blocks
+            half = self.blocks[block]
+            self.blocks[block:block + 1] = [half[:self.load], half[self.load:]]
+            self._build_tree()
+        else:
+            self._tree_add(block, 1)
+
+    def pop(self, position=-1):
+        if position < 0:
+            position += self.length
+        if position < 0 or position >= self.length:
+            raise IndexError("pop index out of range")
+        block, offset = self._locate(position)
+        blocks = self.blocks
+        item = blocks[block].pop(offset)
+        self.length -= 1
+        if len(blocks[block]) < self.load // 2 and len(blocks) > 1:
+            #merge an underfull block into its neighbour to keep m ~ n/load
+            if block == len(blocks) - 1:
+                block -= 1
+            merged = blocks[block] + blocks[block + 1]
+            if len(merged) > 2 * self.load:
+                blocks[block:block + 2] = [merged[:len(merged) // 2], merged[len(merged) // 2:]]
+            else:
+                blocks[block:block + 2] = [merged]
+            self._build_tree()
+        elif not blocks[block]:
+            del blocks[block]
+            self._build_tree()
+        else:
+            self._tree_add(block, -1)
+        return item
+
+
+class ModifiedLinkedList(Instrumented):
+    #"array": plain Python list, O(1) get but O(n) positional insert/delete
+    #"blocked": BlockedIndex, O(log n) get and O(sqrt n) insert/delete
+    INDEX_MODES = ("array", "blocked")
+
+    #deferred=True: insert/delete only relink the chain and log the change;
+    #the index is rebuilt once, on the first get after a write burst
+    def __init__(self, mode="array", deferred=False):
+        if mode not in self.INDEX_MODES:
+            raise ValueError(f"Unknown index mode {mode!r}, expected one of {self.INDEX_MODES}")
+        self.mode = mode
+        self.deferred = deferred
+        self.head = None
+        self.tail = None
+        self.array = [] if mode == "array" else BlockedIndex()
+        #pending change log: (position, node) for inserts, (position, None) for deletes
+        self.pending = []
+        self.pendingDelta = 0
+        self.pendingLimit = 64
+        self.rebuilds = 0
+        self.rebuildsAvoided = 0
+
+    def __len__(self):
+        return len(self.array) + self.pendingDelta
+
+    #O(p) for p pending changes: maps a current position back through the
+    #change log to the node it names, without touching the stale index
+    def _node_at(self, position):
+        for loggedPosition, loggedNode in reversed(self.pending):
+            if loggedNode is not None:
+                if position == loggedPosition:
+                    return loggedNode
+                if position > loggedPosition:
+                    position -= 1
+            elif position >= loggedPosition:
+                position += 1
+        return self.array[position]
+
+    #aux index entries moved by an eager insert/pop at `position`
+    def _shift_cost(self, position):
+        if self.deferred:
+            return 0
+        if self.mode == "array":
+            return len(self.array) - position
+        return self.array.shift_cost(position)
+
+    def _index_insert(self, position, node):
+        if self.deferred:
+            self.pending.append((position, node))
+            self.pendingDelta += 1
+            if len(self.pending) > self.pendingLimit:
+                self._sync()
+        else:
+            self.array.insert(position, node)
+
+    def _index_pop(self, position):
+        if self.deferred:
+            self.pending.append((position, None))
+            self.pendingDelta -= 1
+            if len(self.pending) > self.pendingLimit:
+                self._sync()
+        else:
+            self.array.pop(position)
+
+    #O(n): one walk of the chain replaces all logged index updates
+    def _sync(self):
+        if not self.pending:
+            return
+        nodes = []
+        currNode = self.head
+        while currNode:
+            nodes.append(currNode)
+            currNode = currNode.next
+        if self.mode == "array":
+            self.array = nodes
+        else:
+            self.array._rebuild(nodes)
+        if self.stats is not None:
+            self.stats.record("rebuild", hops=len(nodes), shifts=len(nodes))
+        self.rebuilds += 1
+        self.rebuildsAvoided += len(self.pending) - 1
+        self.pending = []
+        self.pendingDelta = 0
+        #keep log resolution cheap relative to a rebuild: ~sqrt(n) entries
+        self.pendingLimit = max(64, math.isqrt(len(nodes)))
 
     #for testing
     def append(self, value):
+        if self.stats is not None:
+            self.stats.record("append", allocs=1)
         newNode = Node(value)
         if self.head is None:
             self.head = self.tail = newNode
@@ -79,8 +582,12 @@ class ModifiedLinkedList:
 
 
 
-    #O(1)
+    #O(1), plus one O(n) rebuild after a deferred write burst
     def get(self, position):
+        if self.pending:
+            self._sync()
+        if self.stats is not None:
+            self.stats.record("get")
         if position < 0 or position > len(self.array):
             print("Position out of bounds")
         else:
@@ -88,65 +595,134 @@ class ModifiedLinkedList:
 
 
     def insert(self, position, value):
-        #time taken for node to be added to linked list
-        initial_time_taken = 0 
-        #total time taken for node to be added and array to be updated
-        actual_time_taken = 0 
-        #Create new node
-        newNode = Node(value)
-
-        #starts timer after node is created
-        start_time = time.process_time() 
-
         #Index out of bounds
-        if position < 0 or position > len(self.array):
+        if position < 0 or position > len(self):
             print("Position out of bounds")
+            return
+
+        if self.stats is not None:
+            self.stats.record("insert", shifts=self._shift_cost(position), allocs=1)
+        #Create new node
+        newNode = Node(value)
 
         #Insert to front of list
-        elif position == 0:
+        if position == 0:
             
             #new node -> current head
-            newNode.next = self.array[0]
+            newNode.next = self.head
             #update head 
             self.head= newNode
+            if self.tail is None:
+                self.tail = newNode
 
             #adds new node into auxiliary array
-            self.array.insert(0, newNode)
+            self._index_insert(0, newNode)
 
         else:
             #jump to prev node in O(1)
-            prevNode = self.array[position-1]
+            prevNode = self._node_at(position-1)
             #new node -> next node
             newNode.next = prevNode.next
             #prev node -> new node -> next node
             prevNode.next = newNode
-
-            #Calculate time taken for node to be added to linked list
-            end_time = time.process_time()
-            initial_time_taken = end_time-start_time
-
+            if prevNode is self.tail:
+                self.tail = newNode
 
             #adds new node into auxiliary array
-            self.array.insert(position, newNode)
-
-        #Calculate time taken for node to be added to linked list AND array
-        end_time = time.process_time()
-        actual_time_taken = end_time-start_time
-
-        return initial_time_taken, actual_time_taken
+            self._index_insert(position, newNode)
 
 
     #O(1)
     def delete(self, position):
-        if position < 0 or position > len(self.array):
+        if position < 0 or position >= len(self):
             print("Position out of bounds")
-        elif position == 0:
+            return
+        if self.stats is not None:
+            self.stats.record("delete", shifts=max(self._shift_cost(position) - 1, 0))
+        if position == 0:
             self.head = self.head.next
-            self.array.pop(position)
+            if self.head is None:
+                self.tail = None
+            self._index_pop(position)
         else:
-            targetNode = self.array[position-1]
+            targetNode = self._node_at(position-1)
             targetNode.next = targetNode.next.next
-            self.array.pop(position)
+            if targetNode.next is None:
+                self.tail = targetNode
+            self._index_pop(position)
+
+    #links fresh nodes for a batch of values, returns them in order
+    def _chain(self, values):
+        nodes = [Node(value) for value in values]
+        for i in range(len(nodes) - 1):
+            nodes[i].next = nodes[i + 1]
+        return nodes
+
+    #O(k): one splice onto the tail, one bulk extend of the aux array
+    def extend(self, values):
+        self._sync()
+        nodes = self._chain(values)
+        if not nodes:
+            return
+        if self.stats is not None:
+            self.stats.record("extend", allocs=len(nodes))
+        if self.head is None:
+            self.head = nodes[0]
+        else:
+            self.tail.next = nodes[0]
+        self.tail = nodes[-1]
+        self.array.extend(nodes)
+
+    #O(n + k): the chain is spliced once and the aux array in one slice assignment
+    def insert_many(self, position, values):
+        self._sync()
+        if position < 0 or position > len(self.array):
+            print("Position out of bounds")
+            return
+        if position == len(self.array):
+            self.extend(values)
+            return
+        nodes = self._chain(values)
+        if not nodes:
+            return
+        if self.stats is not None:
+            #the blocked index re-blocks everything on a slice assignment
+            moved = len(self.array) - position if self.mode == "array" else len(self.array) + len(nodes)
+            self.stats.record("insert_many", shifts=moved, allocs=len(nodes))
+        if position == 0:
+            nodes[-1].next = self.head
+            self.head = nodes[0]
+        else:
+            prevNode = self.array[position-1]
+            nodes[-1].next = prevNode.next
+            prevNode.next = nodes[0]
+        self.array[position:position] = nodes
+
+    #O(n): removes positions start..stop-1 with one unlink and one slice delete
+    def delete_range(self, start, stop):
+        self._sync()
+        if start < 0 or stop > len(self.array) or start > stop:
+            print("Position out of bounds")
+            return
+        if start == stop:
+            return
+        if self.stats is not None:
+            moved = len(self.array) - stop if self.mode == "array" else len(self.array) - (stop - start)
+            self.stats.record("delete_range", shifts=moved)
+        afterNode = self.array[stop] if stop < len(self.array) else None
+        if start == 0:
+            self.head = afterNode
+        else:
+            self.array[start-1].next = afterNode
+        if afterNode is None:
+            self.tail = self.array[start-1] if start > 0 else None
+        del self.array[start:stop]
+
+    def __iter__(self):
+        currNode = self.head
+        while currNode is not None:
+            yield currNode.data
+            currNode = currNode.next
 
     def printAll(self):
             currNode = self.head
@@ -155,6 +731,210 @@ class ModifiedLinkedList:
                 currNode = currNode.next
             print()
 
+class ArenaLinkedList:
+    """
+    Linked list stored in an arena of parallel arrays instead of Node
+    objects. Slot i holds data[i] and next[i] (the slot index of the
+    following node, NIL at the end); `order` maps positions to slots like
+    ModifiedLinkedList.array. Deleted slots are chained on a free list and
+    reused by later allocations.
+
+    Pass a typecode (e.g. "q" or "d") to keep the data in a typed array as
+    well; otherwise data is held in a Python list.
+    """
+    NIL = -1
+
+    def __init__(self, typecode=None):
+        self.data = array(typecode) if typecode else []
+        self.next = array("q")
+        self.order = array("q")
+        self.head = self.NIL
+        self.tail = self.NIL
+        self.free = self.NIL
+
+    def __len__(self):
+        return len(self.order)
+
+    def _alloc(self, value):
+        slot = self.free
+        if slot != self.NIL:
+            self.free = self.next[slot]
+            self.data[slot] = value
+            self.next[slot] = self.NIL
+        else:
+            slot = len(self.next)
+            self.data.append(value)
+            self.next.append(self.NIL)
+        return slot
+
+    def _release(self, slot):
+        self.next[slot] = self.free
+        self.free = slot
+        if isinstance(self.data, list):
+            #drop the reference so the value can be garbage collected
+            self.data[slot] = None
+
+    #for testing
+    def append(self, value):
+        slot = self._alloc(value)
+        if self.head == self.NIL:
+            self.head = self.tail = slot
+        else:
+            self.next[self.tail] = slot
+            self.tail = slot
+        self.order.append(slot)
+
+    #O(1)
+    def get(self, position):
+        if position < 0 or position >= len(self.order):
+            print("Position out of bounds")
+        else:
+            return self.data[self.order[position]]
+
+    def insert(self, position, value):
+        if position < 0 or position > len(self.order):
+            print("Position out of bounds")
+            return
+        if position == len(self.order):
+            self.append(value)
+            return
+        slot = self._alloc(value)
+        if position == 0:
+            self.next[slot] = self.head
+            self.head = slot
+        else:
+            prevSlot = self.order[position - 1]
+            self.next[slot] = self.next[prevSlot]
+            self.next[prevSlot] = slot
+        self.order.insert(position, slot)
+
+    def delete(self, position):
+        if position < 0 or position >= len(self.order):
+            print("Position out of bounds")
+            return
+        slot = self.order.pop(position)
+        if position == 0:
+            self.head = self.next[slot]
+        else:
+            prevSlot = self.order[position - 1]
+            self.next[prevSlot] = self.next[slot]
+            if slot == self.tail:
+                self.tail = prevSlot
+        if not self.order:
+            self.head = self.tail = self.NIL
+        self._release(slot)
+
+    def __iter__(self):
+        slot = self.head
+        while slot != self.NIL:
+            yield self.data[slot]
+            slot = self.next[slot]
+
+    def printAll(self):
+        slot = self.head
+        while slot != self.NIL:
+            nextSlot = self.next[slot]
+            print(self.data[slot], end=" -> " if nextSlot != self.NIL else "")
+            slot = nextSlot
+        print()
+
+class MappedLinkedList:
+    """
+    Read-only linked list served from a memory-mapped file. save() writes a
+    header followed by one fixed-size (next, value) int64 record per node,
+    in list order; open() maps the file so get(i) reads record i directly
+    and the OS pages records in lazily on first touch. Read-only mappings of
+    one file share the page cache, so worker processes can all open it.
+    """
+    MAGIC = b"Q1LL"
+    VERSION = 1
+    #magic, version, node count, head record
+    HEADER = struct.Struct("<4sIqq")
+    NIL = -1
+    #records buffered per write() call while saving
+    CHUNK = 65536
+
+    def __init__(self, file, buffer):
+        self.file = file
+        self.buffer = buffer
+        magic, version, self.count, self.head = self.HEADER.unpack_from(buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError("Not a Q1 linked list file")
+        #flat int64 view: records[2*i] is next, records[2*i + 1] is value
+        self.records = memoryview(buffer)[self.HEADER.size:].cast("q")
+
+    #O(n) single streaming pass over any list variant holding int values
+    @classmethod
+    def save(cls, linkedList, path):
+        with open(path, "wb") as f:
+            f.write(bytes(cls.HEADER.size))
+            count = 0
+            chunk = array("q")
+            for value in linkedList:
+                if len(chunk) >= 2 * cls.CHUNK:
+                    f.write(chunk.tobytes())
+                    chunk = array("q")
+                chunk.append(count + 1)
+                chunk.append(value)
+                count += 1
+            #the final record is always still buffered: terminate the chain
+            if count:
+                chunk[-2] = cls.NIL
+            f.write(chunk.tobytes())
+            f.seek(0)
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, count, 0 if count else cls.NIL))
+
+    #O(1): nothing is read until a record is accessed
+    @classmethod
+    def open(cls, path):
+        file = open(path, "rb")
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            file.close()
+            raise
+        return cls(file, buffer)
+
+    def close(self):
+        if self.buffer is None:
+            return
+        #the memoryview must be released before the mapping can close
+        if getattr(self, "records", None) is not None:
+            self.records.release()
+            self.records = None
+        self.buffer.close()
+        self.file.close()
+        self.buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    #O(1)
+    def get(self, position):
+        if position < 0 or position >= self.count:
+            print("Position out of bounds")
+        else:
+            return self.records[2 * position + 1]
+
+    #follows the stored next links
+    def __iter__(self):
+        records = self.records
+        record = self.head
+        while record != self.NIL:
+            yield records[2 * record + 1]
+            record = records[2 * record]
+
+    def printAll(self):
+        print(" -> ".join(str(value) for value in self))
+
+
 if __name__ == "__main__":
     def testcase1():
         print("=== Test Case 1: GET ===")
@@ -219,39 +999,137 @@ if __name__ == "__main__":
         print("Delete index 2:")
         testList.printAll()
 
-    def testcase4():
-        print("=== Test Case 4 ===")
-        print("Testing with 100000 records")   
-        noOfTestCase = 1000000
-        oldList = LinkedList()
-        modifiedList = ModifiedLinkedList()
-
-        print("generating records...")
-        for i in range(noOfTestCase):
-            oldList.append(Node(i))
-            modifiedList.append(Node(i))
-
-        print("calculating insert time for regular linked list...")
-        old_timetaken = oldList.insert(int(noOfTestCase * 0.8), "x")
-        print("calculating insert time for hybrid linked list...")
-        initial_timetaken, actual_timetaken = modifiedList.insert(int(noOfTestCase * 0.8), "x")
-
-        print("\n" + "="*70)
-        print("                    PERFORMANCE COMPARISON RESULTS")
-        print("="*70)
-        print(f"{'Operation':<25} {'Time (s)':<12} {'Speedup vs Regular':<18}")
-        print("-"*70)
-        
-        print(f"{'Regular LL insert':<25} {old_timetaken:<18.6f} {'1.00x':<18}")
-        print(f"{'Hybrid LL only':<25} {initial_timetaken:<18.6f} {old_timetaken/initial_timetaken:.0f}x")
-        print(f"{'Hybrid Total':<25} {actual_timetaken:<18.6f} {old_timetaken/actual_timetaken:.0f}x")
-        
-        print("-"*70)
-        overall_speedup = old_timetaken/actual_timetaken
-        print(f"{'OVERALL SPEEDUP':<44} {overall_speedup:.0f}x")
-        print("="*70 + "\n")
-        
-testcase1()
-testcase2()
-testcase3()
-testcase4()
\ No newline at end of file
+    def testcase5():
+        print("=== Test Case 5: ARENA LIST ===")
+        testList = ArenaLinkedList()
+        for value in "ABCDE":
+            testList.append(value)
+        print("List contents:", end="")
+        testList.printAll()
+
+        testList.delete(0)
+        print("Delete index 0:")
+        testList.printAll()
+
+        #the freed slot is reused by the next insert
+        testList.insert(2, "X")
+        print(f"Insert 'X' at index 2 (slot {testList.order[2]}):")
+        testList.printAll()
+        print(f"Get index 2: {testList.get(2)}")
+
+        intList = ArenaLinkedList("q")
+        for i in range(5):
+            intList.append(i * 10)
+        intList.delete(4)
+        intList.append(99)
+        print("Typed arena list:", end="")
+        intList.printAll()
+
+    def testcase6():
+        print("=== Test Case 6: BATCH OPERATIONS ===")
+        testList = ModifiedLinkedList()
+        testList.extend(["A", "B", "C"])
+        print("Extend with A, B, C:")
+        testList.printAll()
+
+        testList.insert_many(1, ["X", "Y", "Z"])
+        print("Insert X, Y, Z at index 1:")
+        testList.printAll()
+
+        testList.delete_range(2, 5)
+        print("Delete range [2, 5):")
+        testList.printAll()
+
+        testList.extend(["D"])
+        print(f"Extend with D (tail is {testList.tail.data}):")
+        testList.printAll()
+
+    def testcase7():
+        print("=== Test Case 7: DEFERRED INDEX ===")
+        testList = ModifiedLinkedList(deferred=True)
+        testList.extend(["A", "B", "C", "D"])
+
+        #write burst: only the chain and the change log are touched
+        testList.insert(0, "X")
+        testList.insert(3, "Y")
+        testList.delete(1)
+        testList.insert(5, "Z")
+        print(f"After 4 writes: {len(testList.pending)} pending changes")
+        testList.printAll()
+
+        #first read rebuilds the index once
+        print(f"Get index 4: {testList.get(4)}")
+        print(f"Rebuilds: {testList.rebuilds}, rebuilds avoided: {testList.rebuildsAvoided}")
+
+    def testcase8():
+        print("=== Test Case 8: CURSOR ===")
+        testList = LinkedList()
+        for value in "ABCDE":
+            testList.append(value)
+
+        #sequential gets resume from the finger instead of the head
+        print("Sequential get:", [testList.get(i) for i in range(5)])
+        print("Iterate:", list(testList))
+        #a negative position reads the head and must not move the finger
+        print("Get -1 then 0:", testList.get(-1), testList.get(0))
+
+        cursor = testList.cursor(1)
+        cursor.insert("X")
+        cursor.next()
+        cursor.next()
+        cursor.delete()
+        print(f"Cursor at index {cursor.position} ({cursor.get()}):", list(testList))
+        cursor.move(4)
+        cursor.insert("Z")
+        print(f"Insert 'Z' after index 4 (tail is {testList.tail.data}):", list(testList))
+
+    def testcase9():
+        print("=== Test Case 9: DOUBLY LINKED LIST ===")
+        testList = DoublyLinkedList()
+        for value in "ABCDE":
+            testList.append(value)
+        print("List contents:", end="")
+        testList.printAll()
+
+        testList.insert(4, "X")
+        print("Insert 'X' at index 4 (walks back from the tail):")
+        testList.printAll()
+
+        testList.delete(5)
+        print(f"Delete index 5 (tail is now {testList.tail.data}):")
+        testList.printAll()
+
+        testList.insert(5, "Z")
+        print(f"Insert 'Z' at index 5 (tail is now {testList.tail.data}):")
+        testList.printAll()
+        print(f"Get index 1: {testList.get(1)}")
+
+    def testcase10():
+        print("=== Test Case 10: MEMORY-MAPPED LIST ===")
+        import os
+        import tempfile
+        testList = ModifiedLinkedList()
+        testList.extend([10, 20, 30, 40])
+        testList.insert(2, 25)
+
+        path = os.path.join(tempfile.mkdtemp(), "list.q1ll")
+        MappedLinkedList.save(testList, path)
+        print(f"Saved {len(testList)} records ({os.path.getsize(path)} bytes)")
+
+        with MappedLinkedList.open(path) as mappedList:
+            print("Mapped contents:", end=" ")
+            mappedList.printAll()
+            print(f"Get index 2: {mappedList.get(2)}")
+            print(f"Get index 5: {mappedList.get(5)}")
+        os.remove(path)
+
+    testcase1()
+    testcase2()
+    testcase3()
+    testcase5()
+    testcase6()
+    testcase7()
+    testcase8()
+    testcase9()
+    testcase10()
+    #performance comparisons live in Q1_benchmark.py
@@ -0,0 +1,225 @@
+"""
+Linked List Benchmark Suite (Q1)
+Sweeps list sizes, operation positions and operation mixes across every
+list variant in Q1.py, runs repeated perf_counter trials and reports
+median/p95 latency and peak build memory, optionally as JSON.
+
+Usage: python Q1_benchmark.py [--sizes N ...] [--trials T] [--json PATH]
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from Q1 import ArenaLinkedList, DoublyLinkedList, LinkedList, ModifiedLinkedList
+
+VARIANTS = {
+    "LinkedList": LinkedList,
+    "ModifiedLinkedList": ModifiedLinkedList,
+    "ModifiedLinkedList[blocked]": lambda: ModifiedLinkedList(mode="blocked"),
+    "ModifiedLinkedList[deferred]": lambda: ModifiedLinkedList(deferred=True),
+    "DoublyLinkedList": DoublyLinkedList,
+    "ArenaLinkedList": lambda: ArenaLinkedList("q"),
+}
+
+# Fraction of the list length at which single operations are measured
+POSITIONS = {"head": 0.0, "middle": 0.5, "80%": 0.8, "tail": 1.0}
+
+# (get, insert, delete) weights; inserts and deletes are kept equal so a
+# mix leaves the list at its original size for the next trial
+MIXES = {
+    "read-heavy": (0.90, 0.05, 0.05),
+    "balanced": (0.50, 0.25, 0.25),
+    "write-heavy": (0.10, 0.45, 0.45),
+}
+
+
+def summarize(samples):
+    """Median, p95 (nearest rank), min and mean of a list of seconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, max(0, -(-95 * len(ordered) // 100) - 1))]
+    return {
+        "median_s": statistics.median(ordered),
+        "p95_s": p95,
+        "min_s": ordered[0],
+        "mean_s": statistics.fmean(ordered),
+        "trials": len(ordered),
+    }
+
+
+def build(factory, size):
+    lst = factory()
+    for i in range(size):
+        lst.append(i)
+    return lst
+
+
+def measure_build(factory, size, trials, memory):
+    times = []
+    lst = None
+    for _ in range(trials):
+        lst = None
+        start = time.perf_counter()
+        lst = build(factory, size)
+        times.append(time.perf_counter() - start)
+    result = summarize(times)
+    if memory:
+        # Separate pass: tracemalloc slows allocation too much to time under it
+        lst = None
+        tracemalloc.start()
+        lst = build(factory, size)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return lst, result
+
+
+def cold(lst):
+    """Drop LinkedList's finger so each trial walks from the head."""
+    if getattr(lst, "finger", None) is not None:
+        lst.finger = None
+
+
+def measure_position(lst, size, op, fraction, trials):
+    # LinkedList edits act after the node at `position`, so keep one node spare
+    position = min(int(size * fraction), size - 2)
+    if op == "get":
+        position = min(int(size * fraction), size - 1)
+    times = []
+    for _ in range(trials):
+        cold(lst)
+        if op == "get":
+            start = time.perf_counter()
+            lst.get(position)
+            times.append(time.perf_counter() - start)
+        elif op == "insert":
+            start = time.perf_counter()
+            lst.insert(position, -1)
+            times.append(time.perf_counter() - start)
+            cold(lst)
+            lst.delete(position)
+        else:
+            start = time.perf_counter()
+            lst.delete(position)
+            times.append(time.perf_counter() - start)
+            cold(lst)
+            lst.insert(position, -1)
+    return summarize(times)
+
+
+def make_mix(size, weights, ops, seed):
+    """Seeded op sequence with equal inserts and deletes, valid for every variant."""
+    rng = random.Random(seed)
+    get_w, ins_w, _ = weights
+    edits = round(ops * ins_w)
+    kinds = ["get"] * (ops - 2 * edits) + ["insert"] * edits + ["delete"] * edits
+    rng.shuffle(kinds)
+    sequence = []
+    current = size
+    for kind in kinds:
+        if kind == "delete" and current <= 2:
+            kind = "insert"
+        sequence.append((kind, rng.randrange(current - 1)))
+        current += {"get": 0, "insert": 1, "delete": -1}[kind]
+    return sequence
+
+
+def measure_mix(lst, sequence, trials):
+    times = []
+    for _ in range(trials):
+        get, insert, delete = lst.get, lst.insert, lst.delete
+        start = time.perf_counter()
+        for kind, position in sequence:
+            if kind == "get":
+                get(position)
+            elif kind == "insert":
+                insert(position, -1)
+            else:
+                delete(position)
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def run(sizes, trials, mix_ops, seed, memory, variants):
+    results = []
+    for size in sizes:
+        for name in variants:
+            factory = VARIANTS[name]
+            print(f"[{size:>9,}] {name}", file=sys.stderr)
+            lst, build_result = measure_build(factory, size, max(1, trials // 3), memory)
+            results.append({"variant": name, "size": size, "kind": "build", **build_result})
+
+            for op in ("get", "insert", "delete"):
+                for label, fraction in POSITIONS.items():
+                    result = measure_position(lst, size, op, fraction, trials)
+                    results.append({"variant": name, "size": size, "kind": "op",
+                                    "op": op, "position": label, **result})
+
+            for label, weights in MIXES.items():
+                # O(n) variants at O(n) per op make large mixes impractical
+                ops = mix_ops if size <= 100000 or name not in ("LinkedList", "DoublyLinkedList") else mix_ops // 10
+                sequence = make_mix(size, weights, ops, seed)
+                result = measure_mix(lst, sequence, trials)
+                results.append({"variant": name, "size": size, "kind": "mix",
+                                "mix": label, "ops": len(sequence), **result})
+            lst = None
+    return results
+
+
+def print_report(results):
+    print("\n" + "=" * 96)
+    print("LINKED LIST BENCHMARK (median / p95, microseconds)")
+    print("=" * 96)
+    print(f"{'Variant':<30} {'Size':>10} {'Case':<22} {'Median':>12} {'p95':>12} {'Peak MB':>8}")
+    print("-" * 96)
+    for r in results:
+        if r["kind"] == "build":
+            case = "build"
+        elif r["kind"] == "op":
+            case = f"{r['op']} @ {r['position']}"
+        else:
+            case = f"mix {r['mix']} x{r['ops']}"
+        peak = f"{r['peak_bytes'] / 2**20:8.1f}" if "peak_bytes" in r else ""
+        print(f"{r['variant']:<30} {r['size']:>10,} {case:<22} "
+              f"{r['median_s'] * 1e6:>12.1f} {r['p95_s'] * 1e6:>12.1f} {peak:>8}")
+    print("=" * 96)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Q1 linked list variants.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--trials", type=int, default=7)
+    parser.add_argument("--mix-ops", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1008)
+    parser.add_argument("--variants", nargs="+", choices=sorted(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc build pass")
+    parser.add_argument("--json", metavar="PATH", help="write machine-readable results to PATH")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.trials, args.mix_ops, args.seed, not args.no_memory, args.variants)
+    print_report(results)
+
+    if args.json:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "sizes": args.sizes,
+                "trials": args.trials,
+                "mix_ops": args.mix_ops,
+                "seed": args.seed,
+            },
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,48 +3,306 @@ Graph 2-Coloring Problem - O(2^n) Exponential Algorithm
 Demonstrates exponential time complexity through exhaustive backtracking.
 """
 
-from typing import List, Tuple
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, islice, product
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import math
+import operator
 import time
 import sys
 
+# Smallest component worth shipping to a process pool. Measured against
+# ~15 ms pool startup: the pruned search 2-colors ~4 vertices per us, so
+# 10k vertices take ~15 ms; with 3+ colors the count grows exponentially
+# and ~14 vertices already take 20-30 ms.
+PARALLEL_COMPONENT_VERTICES = 10000
+PARALLEL_COMPONENT_VERTICES_K = 14
+
+
+def _check_num_vertices(num_vertices: int) -> None:
+    if num_vertices <= 0:
+        raise ValueError("Number of vertices must be positive")
+
+
+def _check_edge(u: int, v: int, num_vertices: int) -> None:
+    if u < 0 or u >= num_vertices or v < 0 or v >= num_vertices:
+        raise ValueError(f"Invalid edge ({u}, {v})")
+    if u == v:
+        raise ValueError(f"Self-loop at vertex {u}")
+
+
+class CSRGraph:
+    """
+    Compact undirected graph: neighbours of u are
+    neighbours[offsets[u]:offsets[u + 1]] in typed arrays, about
+    8 bytes per vertex plus 8 per edge, instead of a list of lists of
+    int objects. graph[u] is a zero-copy view, so Graph2ColoringSolver
+    can use the graph as its adjacency list.
+    """
+
+    def __init__(self, num_vertices: int, offsets: array, neighbours: array):
+        self.num_vertices = num_vertices
+        self.offsets = offsets
+        self.neighbours = neighbours
+        self._view = memoryview(neighbours)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[int, int]], num_vertices: Optional[int] = None,
+                   chunk_size: int = 1 << 16) -> "CSRGraph":
+        """
+        Ingest edges `chunk_size` at a time into two typed arrays, then
+        counting-sort them into CSR form. num_vertices=None takes the
+        largest endpoint + 1.
+        """
+        if num_vertices is not None:
+            _check_num_vertices(num_vertices)
+        typecode = "i" if num_vertices is not None and num_vertices < 2**31 else "q"
+        sources, targets = array(typecode), array(typecode)
+        edges = iter(edges)
+        while True:
+            chunk = list(islice(edges, chunk_size))
+            if not chunk:
+                break
+            us = [u for u, _ in chunk]
+            vs = [v for _, v in chunk]
+            # One C-level scan per check; the slow path only names the bad edge
+            limit = num_vertices if num_vertices is not None else float("inf")
+            if (min(min(us), min(vs)) < 0 or max(max(us), max(vs)) >= limit
+                    or any(map(operator.eq, us, vs))):
+                for u, v in chunk:
+                    _check_edge(u, v, limit)
+            sources.extend(us)
+            targets.extend(vs)
+
+        if num_vertices is None:
+            num_vertices = max(max(sources, default=-1), max(targets, default=-1)) + 1
+            _check_num_vertices(num_vertices)
+
+        # Counting sort: degree prefix sums, then drop each edge in both slots
+        degree = array("q", bytes(8 * (num_vertices + 1)))
+        for u in sources:
+            degree[u + 1] += 1
+        for v in targets:
+            degree[v + 1] += 1
+        offsets = array("q", accumulate(degree))
+        del degree
+        neighbours = array(sources.typecode, bytes(sources.itemsize * offsets[-1]))
+        cursor = array("q", offsets)
+        for u, v in zip(sources, targets):
+            neighbours[cursor[u]] = v
+            cursor[u] += 1
+            neighbours[cursor[v]] = u
+            cursor[v] += 1
+        return cls(num_vertices, offsets, neighbours)
+
+    @classmethod
+    def from_file(cls, path: str, num_vertices: Optional[int] = None,
+                  chunk_size: int = 1 << 16) -> "CSRGraph":
+        """Edge-list file with one 'u v' pair per line; blank and # lines are skipped."""
+        with open(path) as f:
+            pairs = (line.split() for line in f)
+            edges = ((int(pair[0]), int(pair[1])) for pair in pairs if pair and not pair[0].startswith("#"))
+            return cls.from_edges(edges, num_vertices, chunk_size)
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __getitem__(self, u: int) -> memoryview:
+        return self._view[self.offsets[u]:self.offsets[u + 1]]
+
+    def num_edges(self) -> int:
+        return len(self.neighbours) // 2
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        for u in range(self.num_vertices):
+            for v in self[u]:
+                if u < v:
+                    yield u, v
+
+    def memory_bytes(self) -> int:
+        return self.offsets.itemsize * len(self.offsets) + self.neighbours.itemsize * len(self.neighbours)
+
+
+def _solve_component(task):
+    """Worker: count or list the colorings of one relabelled component."""
+    edges, size, num_colors, order, count_only = task
+    solutions = Graph2ColoringSolver(edges, size).iter_solutions(num_colors=num_colors, order=order)
+    if count_only:
+        return sum(1 for _ in solutions)
+    return list(solutions)
+
+
 class Graph2ColoringSolver:
-   
+    # "exhaustive": every color choice down to the leaves, then _is_valid
+    # "pruned": each vertex checked against colored neighbours as it is placed
+    MODES = ("exhaustive", "pruned")
+    # Vertex orders for pruned search; BFS colors a neighbour of every vertex first
+    ORDERS = ("natural", "bfs", "degree")
     
-    def __init__(self, edges: List[Tuple[int, int]], num_vertices: int):
+    def __init__(self, edges: Union[List[Tuple[int, int]], CSRGraph], num_vertices: Optional[int] = None):
    
-        if num_vertices <= 0:
-            raise ValueError("Number of vertices must be positive")
-        
-        self.num_vertices = num_vertices
         self.edges = edges
-        self.adj_list = [[] for _ in range(num_vertices)]
         
-        for u, v in edges:
-            if u < 0 or u >= num_vertices or v < 0 or v >= num_vertices:
-                raise ValueError(f"Invalid edge ({u}, {v})")
-            if u == v:
-                raise ValueError(f"Self-loop at vertex {u}")
+        # A CSRGraph is already validated and serves as the adjacency list
+        if isinstance(edges, CSRGraph):
+            if num_vertices is not None and num_vertices != edges.num_vertices:
+                raise ValueError(f"Graph has {edges.num_vertices} vertices, not {num_vertices}")
+            self.num_vertices = edges.num_vertices
+            self.adj_list = edges
+        else:
+            if num_vertices is None:
+                raise ValueError("num_vertices is required unless edges is a CSRGraph")
+            _check_num_vertices(num_vertices)
+            
+            self.num_vertices = num_vertices
+            self.adj_list = [[] for _ in range(num_vertices)]
             
-            self.adj_list[u].append(v)
-            self.adj_list[v].append(u)
+            for u, v in edges:
+                _check_edge(u, v, num_vertices)
+                
+                self.adj_list[u].append(v)
+                self.adj_list[v].append(u)
         
         self.solutions = []
         self.call_count = 0
+        self.num_colors = 2
     
-    def solve(self) -> List[List[int]]:
+    def solve(self, mode: str = "exhaustive", num_colors: int = 2, order: str = "bfs") -> List[List[int]]:
+        """
+        All valid colorings with num_colors colors. call_count counts the
+        search-tree nodes visited: (k^(n+1) - 1) / (k - 1) for exhaustive,
+        only the consistent partial colorings for pruned.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {self.MODES}")
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown order {order!r}, expected one of {self.ORDERS}")
+        if num_colors < 1:
+            raise ValueError("Number of colors must be positive")
         self.solutions = []
         self.call_count = 0
+        self.num_colors = num_colors
+        
+        if mode == "pruned":
+            for coloring in self._pruned_search(self._vertex_order(order), num_colors):
+                self.solutions.append(coloring.copy())
+            return self.solutions
         
         coloring = [-1] * self.num_vertices
         self._backtrack(0, coloring)
         
         return self.solutions
     
+    def iter_solutions(self, limit: Optional[int] = None, bitmask: bool = False,
+                       num_colors: int = 2, order: str = "bfs") -> Iterator[Union[List[int], int]]:
+        """
+        Lazily yield valid colorings from the pruned search, stopping after
+        `limit` of them. Nothing is stored, so callers can stream, stop
+        early or count. bitmask=True yields each 2-coloring as an int whose
+        bit v is vertex v's color.
+        """
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown order {order!r}, expected one of {self.ORDERS}")
+        if num_colors < 1:
+            raise ValueError("Number of colors must be positive")
+        if bitmask and num_colors > 2:
+            raise ValueError("bitmask output needs num_colors <= 2")
+        self.call_count = 0
+        self.num_colors = num_colors
+        
+        # Checks above run at the call; only the search itself is lazy
+        return self._iter_solutions(self._vertex_order(order), num_colors, limit, bitmask)
+
+    def _iter_solutions(self, order: List[int], num_colors: int, limit: Optional[int],
+                        bitmask: bool) -> Iterator[Union[List[int], int]]:
+        solutions = self._pruned_search(order, num_colors)
+        for coloring in islice(solutions, limit):
+            if bitmask:
+                # Vertex 0 is the lowest bit: int() reads the reversed digits
+                yield int("".join(map(str, reversed(coloring))), 2)
+            else:
+                yield coloring.copy()
+    
+    def components(self) -> List[List[int]]:
+        """Connected components as sorted vertex lists, O(V+E)."""
+        seen = [False] * self.num_vertices
+        result = []
+        for start in range(self.num_vertices):
+            if seen[start]:
+                continue
+            seen[start] = True
+            component = [start]
+            stack = [start]
+            while stack:
+                u = stack.pop()
+                for v in self.adj_list[u]:
+                    if not seen[v]:
+                        seen[v] = True
+                        component.append(v)
+                        stack.append(v)
+            component.sort()
+            result.append(component)
+        return result
+
+    def _component_tasks(self, components: List[List[int]], num_colors: int, order: str, count_only: bool):
+        # Renumber each component 0..size-1 so it is a standalone graph
+        for component in components:
+            local = {v: i for i, v in enumerate(component)}
+            edges = [(local[u], local[v]) for u in component for v in self.adj_list[u] if u < v]
+            yield edges, len(component), num_colors, order, count_only
+
+    def _solve_components(self, components: List[List[int]], num_colors: int, order: str,
+                          count_only: bool, workers: int) -> list:
+        tasks = list(self._component_tasks(components, num_colors, order, count_only))
+        threshold = PARALLEL_COMPONENT_VERTICES if num_colors <= 2 else PARALLEL_COMPONENT_VERTICES_K
+        # Only components big enough to outweigh the pool go to workers,
+        # and only if at least two of them can run side by side
+        heavy = [i for i, component in enumerate(components) if len(component) >= threshold]
+        results = [None] * len(tasks)
+        if workers > 1 and len(heavy) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(heavy))) as pool:
+                for i, result in zip(heavy, pool.map(_solve_component, [tasks[i] for i in heavy])):
+                    results[i] = result
+        for i, task in enumerate(tasks):
+            if results[i] is None:
+                results[i] = _solve_component(task)
+        return results
+
+    def count_solutions(self, num_colors: int = 2, order: str = "bfs", workers: int = 1) -> int:
+        """
+        Number of valid colorings: the product of each connected
+        component's count, so the work grows with the largest component
+        rather than the whole graph. workers > 1 solves components of at
+        least PARALLEL_COMPONENT_VERTICES (_K for 3+ colors) vertices in a
+        process pool.
+        """
+        counts = self._solve_components(self.components(), num_colors, order, True, workers)
+        return math.prod(counts)
+
+    def iter_component_solutions(self, limit: Optional[int] = None, num_colors: int = 2,
+                                 order: str = "bfs", workers: int = 1) -> Iterator[List[int]]:
+        """
+        Solve each component separately, then lazily yield the product of
+        their colorings. Memory holds the per-component solutions only,
+        not the combined ones.
+        """
+        components = self.components()
+        per_component = self._solve_components(components, num_colors, order, False, workers)
+        coloring = [-1] * self.num_vertices
+        for choice in islice(product(*per_component), limit):
+            for component, local in zip(components, choice):
+                for v, color in zip(component, local):
+                    coloring[v] = color
+            yield coloring.copy()
+    
     def _backtrack(self, vertex: int, coloring: List[int]) -> None:
         """
         Binary decision tree: each vertex colored 0 or 1.
         
-        Creates 2 branches per vertex → 2^n total calls.
+        Creates 2 branches per vertex → 2^n total calls
+        (num_colors branches → num_colors^n in general).
         """
         self.call_count += 1
         
@@ -54,15 +312,69 @@ class Graph2ColoringSolver:
                 self.solutions.append(coloring.copy())
             return
         
-        # Try color 0
-        coloring[vertex] = 0
-        self._backtrack(vertex + 1, coloring)
-        
-        # Try color 1
-        coloring[vertex] = 1
-        self._backtrack(vertex + 1, coloring)
+        # Try color 0, then color 1 (and so on for k colors)
+        for color in range(self.num_colors):
+            coloring[vertex] = color
+            self._backtrack(vertex + 1, coloring)
         
         coloring[vertex] = -1
+
+    def _vertex_order(self, order: str) -> List[int]:
+        if order == "natural":
+            return list(range(self.num_vertices))
+        by_degree = sorted(range(self.num_vertices), key=lambda u: -len(self.adj_list[u]))
+        if order == "degree":
+            return by_degree
+
+        # BFS from the highest-degree unvisited vertex of each component
+        seen = [False] * self.num_vertices
+        result = []
+        for start in by_degree:
+            if seen[start]:
+                continue
+            seen[start] = True
+            queue = deque([start])
+            while queue:
+                u = queue.popleft()
+                result.append(u)
+                for v in self.adj_list[u]:
+                    if not seen[v]:
+                        seen[v] = True
+                        queue.append(v)
+        return result
+
+    def _pruned_search(self, order: List[int], num_colors: int) -> Iterator[List[int]]:
+        """
+        Iterative backtracking over `order`: a color is only placed if no
+        already-colored neighbour has it, so dead branches end at once and
+        nothing is checked at the leaves. Yields the shared coloring list.
+        """
+        n = self.num_vertices
+        adj_list = self.adj_list
+        coloring = [-1] * n
+        next_color = [0] * n
+        self.call_count = 1
+        depth = 0
+        while depth >= 0:
+            if depth == n:
+                yield coloring
+                depth -= 1
+                continue
+            vertex = order[depth]
+            color = next_color[depth]
+            neighbours = adj_list[vertex]
+            while color < num_colors and any(coloring[u] == color for u in neighbours):
+                color += 1
+            if color == num_colors:
+                # Exhausted: undo and return to the previous vertex
+                coloring[vertex] = -1
+                next_color[depth] = 0
+                depth -= 1
+                continue
+            coloring[vertex] = color
+            next_color[depth] = color + 1
+            self.call_count += 1
+            depth += 1
     
     def _is_valid(self, coloring: List[int]) -> bool:
         """Check no adjacent vertices have same color."""
@@ -72,12 +384,154 @@ class Graph2ColoringSolver:
                     return False
         return True
 
+    def bipartite(self) -> Dict:
+        """
+        Linear-time mode: BFS 2-colors each connected component, O(V+E).
+
+        Returns {"bipartite", "coloring", "odd_cycle", "components",
+        "num_colorings"}. Every component can have its two colors swapped
+        independently, so a bipartite graph has 2^components colorings;
+        otherwise odd_cycle lists the vertices of one odd cycle in order.
+        """
+        coloring = [-1] * self.num_vertices
+        parent = [-1] * self.num_vertices
+        adj_list = self.adj_list
+        components = 0
+
+        for start in range(self.num_vertices):
+            if coloring[start] != -1:
+                continue
+            components += 1
+            coloring[start] = 0
+            queue = deque([start])
+            while queue:
+                u = queue.popleft()
+                color = 1 - coloring[u]
+                for v in adj_list[u]:
+                    if coloring[v] == -1:
+                        coloring[v] = color
+                        parent[v] = u
+                        queue.append(v)
+                    elif coloring[v] != color:
+                        return {
+                            "bipartite": False,
+                            "coloring": None,
+                            "odd_cycle": self._odd_cycle(u, v, parent),
+                            "components": None,
+                            "num_colorings": 0,
+                        }
+
+        return {
+            "bipartite": True,
+            "coloring": coloring,
+            "odd_cycle": None,
+            "components": components,
+            "num_colorings": 1 << components,
+        }
+
+    def _odd_cycle(self, u: int, v: int, parent: List[int]) -> List[int]:
+        """
+        u and v share a color and lie at the same BFS depth; their tree
+        paths up to the common ancestor plus edge (u, v) form an odd cycle.
+        """
+        left, right = [u], [v]
+        while left[-1] != right[-1]:
+            left.append(parent[left[-1]])
+            right.append(parent[right[-1]])
+        # left ends at the ancestor; right runs back down to v
+        return left + right[-2::-1]
+
+
+class IncrementalBipartiteChecker:
+    """
+    Online 2-colorability as edges arrive. Union-find where each vertex
+    stores the parity of its path to its parent: two vertices in one set
+    get different colors exactly when their parities to the root differ.
+
+    Union by size keeps trees O(log n) deep. Paths are not compressed, so
+    every union can be undone and rollback() removes the newest edges.
+    """
+
+    def __init__(self, num_vertices: int, edges: List[Tuple[int, int]] = ()):
+        _check_num_vertices(num_vertices)
+        self.num_vertices = num_vertices
+        self.parent = list(range(num_vertices))
+        self.parity = [0] * num_vertices
+        self.size = [1] * num_vertices
+        # One entry per added edge: (u, v, root attached below another root or -1)
+        self.history: List[Tuple[int, int, int]] = []
+        self.first_conflict: Optional[Tuple[int, int]] = None
+        self._conflict_at = -1
+        for u, v in edges:
+            self.add_edge(u, v)
+
+    def _find(self, u: int) -> Tuple[int, int]:
+        """(root, parity of u relative to root), O(log n)."""
+        parity = 0
+        while self.parent[u] != u:
+            parity ^= self.parity[u]
+            u = self.parent[u]
+        return u, parity
+
+    def add_edge(self, u: int, v: int) -> bool:
+        """Insert edge (u, v); returns whether the graph is still bipartite."""
+        _check_edge(u, v, self.num_vertices)
+        root_u, parity_u = self._find(u)
+        root_v, parity_v = self._find(v)
+
+        if root_u == root_v:
+            # Same tree: the edge closes a cycle, odd if the parities match
+            if parity_u == parity_v and self.first_conflict is None:
+                self.first_conflict = (u, v)
+                self._conflict_at = len(self.history)
+            self.history.append((u, v, -1))
+            return self.first_conflict is None
+
+        if self.size[root_u] < self.size[root_v]:
+            root_u, root_v = root_v, root_u
+        # Hang the smaller tree so that u and v end up with opposite colors
+        self.parent[root_v] = root_u
+        self.parity[root_v] = parity_u ^ parity_v ^ 1
+        self.size[root_u] += self.size[root_v]
+        self.history.append((u, v, root_v))
+        return self.first_conflict is None
+
+    def rollback(self, count: int = 1) -> List[Tuple[int, int]]:
+        """Remove the `count` most recently added edges; returns them newest first."""
+        if count < 0 or count > len(self.history):
+            raise ValueError(f"Cannot roll back {count} of {len(self.history)} edges")
+        removed = []
+        for _ in range(count):
+            u, v, child = self.history.pop()
+            if child != -1:
+                root = self.parent[child]
+                self.size[root] -= self.size[child]
+                self.parent[child] = child
+                self.parity[child] = 0
+            if len(self.history) == self._conflict_at:
+                self.first_conflict = None
+                self._conflict_at = -1
+            removed.append((u, v))
+        return removed
+
+    def is_bipartite(self) -> bool:
+        return self.first_conflict is None
+
+    def num_edges(self) -> int:
+        return len(self.history)
+
+    def coloring(self) -> Optional[List[int]]:
+        """A valid 2-coloring of the current graph, or None if there is none."""
+        if self.first_conflict is not None:
+            return None
+        return [self._find(u)[1] for u in range(self.num_vertices)]
+
 
 def demonstrate_exponential_growth():
     print("=" * 70)
     print("O(2^n) EXPONENTIAL GROWTH DEMONSTRATION")
     print("=" * 70)
-    print(f"\n{'n':>3} | {'Calls':>12} | {'2^n':>12} | {'Time':>8}")
+    print(f"\n{'n':>3} | {'Calls':>12} | {'2^n':>12} | {'Time':>8} | {'Pruned calls':>12}")
     print("-" * 70)
     
     results = []
@@ -91,7 +545,9 @@ def demonstrate_exponential_growth():
         elapsed = time.time() - start
         
         results.append((n, solver.call_count, elapsed))
-        print(f"{n:3d} | {solver.call_count:12,d} | {2**n:12,d} | {elapsed:8.4f}s")
+        calls = solver.call_count
+        solver.solve(mode="pruned")
+        print(f"{n:3d} | {calls:12,d} | {2**n:12,d} | {elapsed:8.4f}s | {solver.call_count:12,d}")
         
         if elapsed > 3.0:
             print("\n⚠️  Exponential explosion - stopping at n=" + str(n))
@@ -114,6 +570,24 @@ def demonstrate_exponential_growth():
         print(f"n={n_prev:2d} → {n_curr:2d} | ×{ratio:11.2f} | ×{expected:11.1f}")
 
 
+def demonstrate_linear_growth():
+    print("=" * 70)
+    print("O(V+E) BFS BIPARTITE CHECK")
+    print("=" * 70)
+    print(f"\n{'n':>10} | {'Colorings':>12} | {'Time':>8}")
+    print("-" * 70)
+
+    for n in (10**4, 10**5, 10**6):
+        edges = [(i, i+1) for i in range(n-1)]  # Path graph
+        solver = Graph2ColoringSolver(edges, n)
+
+        start = time.time()
+        result = solver.bipartite()
+        elapsed = time.time() - start
+
+        print(f"{n:10,d} | {result['num_colorings']:12,d} | {elapsed:8.4f}s")
+
+
 def test_graph_2_coloring():
     """Essential test cases."""
     print("\n" + "=" * 70)
@@ -148,8 +622,149 @@ def test_graph_2_coloring():
             print(f"  ✗ ERROR: {e}")
             all_passed = False
     
+    # BFS mode must agree with exhaustive enumeration
+    print("\n[Test 6] BFS bipartite mode matches enumeration")
+    extra = [
+        ("Two components", [(0,1), (2,3)], 5),
+        ("Pentagon with tail", [(0,1), (1,2), (2,3), (3,4), (4,0), (4,5)], 6),
+    ]
+    for name, edges, n, *_ in tests + extra:
+        solver = Graph2ColoringSolver(edges, n)
+        expected = len(solver.solve())
+        result = solver.bipartite()
+        ok = result["num_colorings"] == expected
+        if result["bipartite"]:
+            ok = ok and solver._is_valid(result["coloring"])
+        else:
+            cycle = result["odd_cycle"]
+            ok = ok and len(cycle) % 2 == 1 and len(set(cycle)) == len(cycle) and all(
+                cycle[i - 1] in solver.adj_list[cycle[i]] for i in range(len(cycle)))
+        if ok:
+            detail = f"{result['num_colorings']} coloring(s)" if result["bipartite"] else f"odd cycle {result['odd_cycle']}"
+            print(f"  ✓ PASS: {name}: {detail}")
+        else:
+            print(f"  ✗ FAIL: {name}: expected {expected} coloring(s), got {result}")
+            all_passed = False
+
+    # Pruned search: same solutions, far fewer calls, k colors
+    print("\n[Test 7] Pruned search matches exhaustive")
+    cases = [
+        ("Path, 2 colors", [(0,1), (1,2), (2,3), (3,4), (4,5)], 6, 2),
+        ("Triangle, 3 colors", [(0,1), (1,2), (2,0)], 3, 3),
+        ("Pentagon, 2 colors", [(0,1), (1,2), (2,3), (3,4), (4,0)], 5, 2),
+        ("Pentagon, 3 colors", [(0,1), (1,2), (2,3), (3,4), (4,0)], 5, 3),
+    ]
+    for name, edges, n, k in cases:
+        solver = Graph2ColoringSolver(edges, n)
+        expected = sorted(solver.solve(num_colors=k))
+        full_calls = solver.call_count
+        pruned = sorted(solver.solve(mode="pruned", num_colors=k))
+        if pruned == expected and solver.call_count < full_calls:
+            print(f"  ✓ PASS: {name}: {len(pruned)} solution(s), {solver.call_count} vs {full_calls} calls")
+        else:
+            print(f"  ✗ FAIL: {name}: {len(pruned)} vs {len(expected)} solution(s), "
+                  f"{solver.call_count} vs {full_calls} calls")
+            all_passed = False
+
+    # Lazy enumeration: early stop, bitmasks and counting
+    print("\n[Test 8] Lazy solution generator")
+    solver = Graph2ColoringSolver([(0,1), (2,3)], 30)
+    first = list(solver.iter_solutions(limit=3))
+    calls = solver.call_count
+    masks = list(Graph2ColoringSolver([(0,1), (1,2)], 3).iter_solutions(bitmask=True))
+    count = sum(1 for _ in Graph2ColoringSolver([(0,1), (1,2), (3,4)], 6).iter_solutions(bitmask=True))
+    try:
+        solver.iter_solutions(order="bogus")
+        eager = False
+    except ValueError:
+        eager = True
+    if len(first) == 3 and calls < 40 and sorted(masks) == [0b010, 0b101] and count == 8 and eager:
+        print(f"  ✓ PASS: 3 of 2^28 colorings in {calls} calls, masks {sorted(masks)}, count {count}")
+    else:
+        print(f"  ✗ FAIL: {len(first)} colorings in {calls} calls, masks {masks}, count {count}, "
+              f"bad order raised at call: {eager}")
+        all_passed = False
+
+    # Component decomposition: counts multiply, colorings combine
+    print("\n[Test 9] Connected-component decomposition")
+    edges = [(0,1), (1,2), (3,4), (4,5), (5,3), (6,7)]
+    solver = Graph2ColoringSolver(edges, 9)
+    expected = sorted(solver.solve(num_colors=3))
+    counts = (solver.count_solutions(), solver.count_solutions(num_colors=3))
+    combined = sorted(solver.iter_component_solutions(num_colors=3))
+    sizes = [len(c) for c in solver.components()]
+    if counts == (0, len(expected)) and combined == expected and sizes == [3, 3, 2, 1]:
+        print(f"  ✓ PASS: components {sizes}, counts {counts}")
+    else:
+        print(f"  ✗ FAIL: components {sizes}, counts {counts}, expected (0, {len(expected)})")
+        all_passed = False
+    # Two 14-vertex paths are heavy enough for the pool at 3 colors; the pairs stay in-process
+    paths = [(i, i+1) for i in range(13)] + [(i, i+1) for i in range(14, 27)]
+    big = Graph2ColoringSolver(paths + [(28 + 2*i, 29 + 2*i) for i in range(10)], 50)
+    parallel = big.count_solutions(num_colors=3, workers=2)
+    expected = (3 * 2**13) ** 2 * 6 ** 10 * 3 ** 2
+    if parallel == expected == big.count_solutions(num_colors=3):
+        print(f"  ✓ PASS: 50 vertices, 14 components, heavy ones in a process pool: {parallel:,}")
+    else:
+        print(f"  ✗ FAIL: expected {expected:,}, got {parallel:,}")
+        all_passed = False
+
+    # Incremental checker: first conflict, rollback, shared validation
+    print("\n[Test 10] Incremental bipartite checker")
+    checker = IncrementalBipartiteChecker(5)
+    states = [checker.add_edge(u, v) for u, v in [(0,1), (1,2), (2,3), (3,0), (0,2), (2,4)]]
+    conflict = checker.first_conflict
+    still_odd = checker.rollback(1) == [(2,4)] and not checker.is_bipartite()
+    checker.rollback(1)
+    coloring = checker.coloring()
+    valid = coloring is not None and all(coloring[u] != coloring[v] for u, v in [(0,1), (1,2), (2,3), (3,0)])
+    try:
+        checker.add_edge(3, 3)
+        rejected = False
+    except ValueError:
+        rejected = True
+    if states == [True, True, True, True, False, False] and conflict == (0,2) and still_odd and valid and rejected:
+        print(f"  ✓ PASS: first conflict {conflict}, rollback restores coloring {coloring}")
+    else:
+        print(f"  ✗ FAIL: states {states}, conflict {conflict}, coloring {coloring}, rejected {rejected}")
+        all_passed = False
+
+    # CSR graph: streamed in chunks, same answers as the list-based solver
+    print("\n[Test 11] CSR graph and streaming loader")
+    import os
+    import tempfile
+    edges = [(0,1), (1,2), (2,3), (3,0), (4,5), (5,6)]
+    graph = CSRGraph.from_edges(iter(edges), 8, chunk_size=4)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("# u v\n" + "\n".join(f"{u} {v}" for u, v in edges) + "\n\n")
+    try:
+        loaded = CSRGraph.from_file(f.name, 8)
+    finally:
+        os.unlink(f.name)
+    expected = Graph2ColoringSolver(edges, 8)
+    solver = Graph2ColoringSolver(graph)
+    same = (list(loaded.neighbours) == list(graph.neighbours) and sorted(graph.edges()) == sorted((min(e), max(e)) for e in edges)
+            and sorted(solver.solve(mode="pruned")) == sorted(expected.solve())
+            and solver.bipartite()["num_colorings"] == 8 and solver.count_solutions() == 8)
+    rejected = []
+    for bad in ([(0,1), (2,2)], [(0,9)]):
+        try:
+            CSRGraph.from_edges(bad, 8)
+        except ValueError as e:
+            rejected.append(str(e))
+    try:
+        Graph2ColoringSolver([(0,1)])
+    except ValueError as e:
+        rejected.append(str(e))
+    if same and rejected == ["Self-loop at vertex 2", "Invalid edge (0, 9)",
+                             "num_vertices is required unless edges is a CSRGraph"]:
+        print(f"  ✓ PASS: {graph.num_edges()} edges in {graph.memory_bytes()} bytes, errors {rejected}")
+    else:
+        print(f"  ✗ FAIL: same={same}, errors {rejected}")
+        all_passed = False
+
     # Error handling
-    print("\n[Test 6] Self-loop error handling")
+    print("\n[Test 12] Self-loop error handling")
     try:
         Graph2ColoringSolver([(0,0)], 1)
         print("  ✗ FAIL: Should reject self-loop")
@@ -176,12 +791,17 @@ def main():
             print("GRAPH 2-COLORING: Complexity Demo Only\n")
             demonstrate_exponential_growth()
             
+        elif mode == "--linear":
+            print("GRAPH 2-COLORING: Linear-Time Demo Only\n")
+            demonstrate_linear_growth()
+            
         else:
             print(f"Unknown option: {mode}")
-            print("\nUsage: python graph_2_coloring.py [--test|--demo|--all]")
-            print("  --test : Run test suite only")
-            print("  --demo : Run complexity demo only")
-            print("  --all  : Run both (same as no argument)")
+            print("\nUsage: python graph_2_coloring.py [--test|--demo|--linear|--all]")
+            print("  --test   : Run test suite only")
+            print("  --demo   : Run complexity demo only")
+            print("  --linear : Run O(V+E) BFS demo only")
+            print("  --all    : Run both (same as no argument)")
             
     else:
         # Default: run both
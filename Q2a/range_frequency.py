@@ -2,32 +2,574 @@
 Range Frequency Query - O(n log n) algorithm
 """
 
+import argparse
 import bisect
-from typing import List, Tuple, Dict
+import mmap
+import operator
+import struct
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from multiprocessing import shared_memory
+from typing import List, Tuple, Dict, Optional, Sequence, Union
 import sys
 
+from wavelet_matrix import WaveletMatrix
+
+try:
+    import numpy as np
+except ImportError:  # optional: CSRIndex falls back to array + bisect
+    np = None
+
+# Batches at least this large use the offline sweep by default
+OFFLINE_BATCH_THRESHOLD = 10000
+
+# Below this many queries a process pool costs more than it saves
+PARALLEL_BATCH_THRESHOLD = 200000
+
+
+class CSRIndex:
+    """
+    Flat (CSR) layout of the index: `values` holds the distinct values in
+    ascending order and the positions of values[k] are
+    positions[offsets[k]:offsets[k + 1]], ascending.
+
+    Built with one stable argsort. With NumPy, batch_query answers a whole
+    batch with vectorized searchsorted calls; without it the same arrays
+    are searched with bisect. Values must be integers.
+
+    save() writes the three arrays as flat little-endian int64 sections
+    after a small header; load() memory-maps them back without copying.
+    """
+    MAGIC = b"RFQ1"
+    VERSION = 1
+    # magic, version, n (positions), k (distinct values)
+    HEADER = struct.Struct("<4sIqq")
+
+    def __init__(self, values: Sequence[int], offsets: Sequence[int], positions: Sequence[int]):
+        self.values = values
+        self.offsets = offsets
+        self.positions = positions
+        self.n = len(positions)
+        self._keys = None
+        self._mmap = None
+        self._file = None
+
+    @classmethod
+    def from_index_map(cls, index_map: Dict[int, Sequence[int]]) -> "CSRIndex":
+        """Flatten a value -> sorted positions mapping: O(n + k log k)."""
+        values, offsets, positions = array("q"), array("q", [0]), array("q")
+        for value in sorted(index_map):
+            values.append(value)
+            positions.extend(index_map[value])
+            offsets.append(len(positions))
+        return cls(values, offsets, positions)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.n, len(self.values)))
+            for section in (self.values, self.offsets, self.positions):
+                if np is not None and isinstance(section, np.ndarray):
+                    f.write(section.astype("<i8", copy=False).tobytes())
+                else:
+                    f.write(array("q", section).tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "CSRIndex":
+        """Map a saved index: O(1), pages are read on first access."""
+        f = open(path, "rb")
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            f.close()
+            raise
+        magic, version, n, k = cls.HEADER.unpack_from(buffer, 0)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            buffer.close()
+            f.close()
+            raise ValueError(f"{path} is not a saved range frequency index")
+
+        sections = []
+        start = cls.HEADER.size
+        for count in (k, k + 1, n):
+            if np is not None:
+                sections.append(np.frombuffer(buffer, dtype="<i8", count=count, offset=start))
+            else:
+                sections.append(memoryview(buffer)[start:start + 8 * count].cast("q"))
+            start += 8 * count
+        index = cls(*sections)
+        index._mmap, index._file = buffer, f
+        return index
+
+    def close(self) -> None:
+        """Release a loaded index's mapping (no-op for built indexes)."""
+        if self._mmap is None:
+            return
+        sections = (self.values, self.offsets, self.positions)
+        self.values = self.offsets = self.positions = self._keys = None
+        for section in sections:
+            if isinstance(section, memoryview):
+                section.release()
+        # NumPy views hold the buffer until they are freed
+        del section, sections
+        self._mmap.close()
+        self._file.close()
+        self._mmap = self._file = None
+
+    @classmethod
+    def from_array(cls, arr: Sequence[int]) -> "CSRIndex":
+        # Build: O(n log n) for the stable sort, O(n) for the offsets
+        if np is not None:
+            data = np.asarray(arr, dtype=np.int64)
+            order = np.argsort(data, kind="stable")
+            values, starts = np.unique(data[order], return_index=True)
+            offsets = np.append(starts, len(data)).astype(np.int64)
+            return cls(values, offsets, order.astype(np.int64))
+
+        order = sorted(range(len(arr)), key=arr.__getitem__)
+        values, offsets = array("q"), array("q")
+        for k, i in enumerate(order):
+            if not values or arr[i] != values[-1]:
+                values.append(arr[i])
+                offsets.append(k)
+        offsets.append(len(order))
+        return cls(values, offsets, array("q", order))
+
+    def query(self, left: int, right: int, value: int) -> int:
+        # Locate value: O(log k) over the k distinct values
+        k = bisect.bisect_left(self.values, value)
+        if k == len(self.values) or self.values[k] != value:
+            return 0
+        lo, hi = int(self.offsets[k]), int(self.offsets[k + 1])
+
+        # Two binary searches inside the value's slice: O(log m)
+        left_pos = bisect.bisect_left(self.positions, left, lo, hi)
+        right_pos = bisect.bisect_right(self.positions, right, lo, hi)
+        return max(0, right_pos - left_pos)
+
+    def batch_query(self, queries: List[Tuple[int, int, int]]) -> List[int]:
+        if np is None or len(queries) == 0 or len(self.values) == 0:
+            return [self.query(left, right, value) for left, right, value in queries]
+
+        q = np.asarray(queries, dtype=np.int64).reshape(-1, 3)
+        lefts = np.clip(q[:, 0], 0, self.n)
+        rights = np.clip(q[:, 1], -1, self.n - 1)
+        wanted = q[:, 2]
+
+        k = np.searchsorted(self.values, wanted)
+        k_safe = np.minimum(k, len(self.values) - 1)
+        found = (k < len(self.values)) & (self.values[k_safe] == wanted)
+
+        # One global sorted key per position, (value rank, position), so every
+        # query is two searchsorted calls over the same array
+        keys = self._sorted_keys()
+        base = k_safe * (self.n + 1)
+        lo = np.searchsorted(keys, base + lefts, side="left")
+        hi = np.searchsorted(keys, base + rights, side="right")
+        return np.where(found, np.maximum(hi - lo, 0), 0).tolist()
+
+    def _sorted_keys(self):
+        # Built on the first vectorized batch: n extra int64s
+        if self._keys is None:
+            ranks = np.repeat(np.arange(len(self.values), dtype=np.int64), np.diff(self.offsets))
+            self._keys = ranks * (self.n + 1) + self.positions
+        return self._keys
+
+
+# Worker-side state for parallel batches: the CSRIndex view of the shared
+# block, attached once per worker process by _attach_shared_index
+_shared_block = None
+_shared_index = None
+
+
+def _shared_sections(buf, k: int, n: int, with_keys: bool):
+    """Slice a shared block into values, offsets, positions (and keys)."""
+    counts = [k, k + 1, n] + ([n] if with_keys else [])
+    sections, start = [], 0
+    for count in counts:
+        if np is not None:
+            sections.append(np.ndarray((count,), dtype=np.int64, buffer=buf, offset=start))
+        else:
+            sections.append(buf[start:start + 8 * count].cast("q"))
+        start += 8 * count
+    return sections
+
+
+def _attach_shared_index(name: str, k: int, n: int, with_keys: bool) -> None:
+    global _shared_block, _shared_index
+    _shared_block = shared_memory.SharedMemory(name=name)
+    sections = _shared_sections(_shared_block.buf, k, n, with_keys)
+    _shared_index = CSRIndex(*sections[:3])
+    if with_keys:
+        # Reuse the parent's search keys instead of rebuilding n per worker
+        _shared_index._keys = sections[3]
+
+
+def _answer_chunk(chunk: List[Tuple[int, int, int]]) -> List[int]:
+    return _shared_index.batch_query(chunk)
+
+
+def _release_shared(block: shared_memory.SharedMemory, pool: ProcessPoolExecutor) -> None:
+    pool.shutdown()
+    block.close()
+    block.unlink()
+
+
+class SortedPositions:
+    """
+    Sorted positions of one value, kept in blocks of about `load` entries.
+    `maxes` locates a block by bisect and a Fenwick tree over the block
+    lengths turns a block number into a rank, so add, remove and
+    count_range are all O(log n + load).
+    """
+
+    def __init__(self, positions: Sequence[int] = (), load: int = 512):
+        self.load = load
+        items = list(positions)
+        self.blocks = [items[i:i + load] for i in range(0, len(items), load)]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.size = len(items)
+        self._build_tree()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+
+    def _build_tree(self) -> None:
+        tree = [0] + [len(block) for block in self.blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _tree_add(self, block: int, delta: int) -> None:
+        i = block + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, block: int) -> int:
+        total = 0
+        while block:
+            total += self.tree[block]
+            block -= block & -block
+        return total
+
+    def add(self, pos: int) -> None:
+        if not self.blocks:
+            self.blocks, self.maxes, self.size = [[pos]], [pos], 1
+            self._build_tree()
+            return
+        b = min(bisect.bisect_left(self.maxes, pos), len(self.blocks) - 1)
+        block = self.blocks[b]
+        bisect.insort(block, pos)
+        self.maxes[b] = block[-1]
+        self.size += 1
+        if len(block) > 2 * self.load:
+            # Split an overfull block, then re-index the blocks
+            self.blocks[b:b + 1] = [block[:self.load], block[self.load:]]
+            self.maxes[b:b + 1] = [block[self.load - 1], block[-1]]
+            self._build_tree()
+        else:
+            self._tree_add(b, 1)
+
+    def remove(self, pos: int) -> None:
+        b = bisect.bisect_left(self.maxes, pos)
+        block = self.blocks[b]
+        del block[bisect.bisect_left(block, pos)]
+        self.size -= 1
+        if not block:
+            del self.blocks[b], self.maxes[b]
+            self._build_tree()
+        elif len(block) < self.load // 4 and len(self.blocks) > 1:
+            # Merge an underfull block into its neighbour
+            if b == len(self.blocks) - 1:
+                b -= 1
+            self.blocks[b:b + 2] = [self.blocks[b] + self.blocks[b + 1]]
+            self.maxes[b:b + 2] = [self.blocks[b][-1]]
+            self._build_tree()
+        else:
+            self.maxes[b] = block[-1]
+            self._tree_add(b, -1)
+
+    def rank(self, pos: int) -> int:
+        """Number of stored positions < pos."""
+        b = bisect.bisect_left(self.maxes, pos)
+        if b == len(self.blocks):
+            return self.size
+        return self._prefix(b) + bisect.bisect_left(self.blocks[b], pos)
+
+    def count_range(self, left: int, right: int) -> int:
+        return max(0, self.rank(right + 1) - self.rank(left))
+
+
 class RangeFrequencyQuery:
-    def __init__(self, arr: List[int]):
+    # "map": dict of Python position lists (any hashable values)
+    # "csr": flat CSRIndex arrays (integer values, vectorized batches)
+    # "dynamic": dict of SortedPositions, O(log n) update/append/pop
+    # "wavelet": WaveletMatrix, compact bits plus range rank/quantile
+    ENGINES = ("map", "csr", "dynamic", "wavelet")
+
+    def __init__(self, arr: List[int], engine: str = "map", heavy_threshold: Optional[int] = None,
+                 cache_size: Optional[int] = None):
+        """
+        heavy_threshold: values occurring at least this many times get a
+        prefix-count table, making their queries O(1) at a cost of
+        4 * (n + 1) bytes each (see index_memory()). None disables it.
+
+        cache_size: keep the results of up to this many distinct
+        (left, right, value) queries, evicting the least recently used.
+        Cleared on update/append/pop. None disables it.
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {self.ENGINES}")
+        if cache_size is not None and cache_size < 1:
+            raise ValueError(f"cache_size must be positive, got {cache_size}")
+        if engine == "wavelet" and heavy_threshold is not None:
+            raise ValueError("Heavy tables need a positional index; not available with engine='wavelet'")
         self.n = len(arr)
+        self.engine = engine
+        self.index: Optional[Union[CSRIndex, WaveletMatrix]] = None
         self.index_map: Dict[int, List[int]] = {}
-        
-        # Build index map: O(n)
-        for i, val in enumerate(arr):
-            if val not in self.index_map:
-                self.index_map[val] = []
-            self.index_map[val].append(i)
-        
-        # Sort all index lists: O(n log n) total
-        for val in self.index_map:
-            self.index_map[val].sort()
+        # Plain copy of the array, built on the first update/append/pop only
+        self.arr: Optional[List[int]] = None
+        self.heavy_threshold = heavy_threshold
+        self.heavy: Dict[int, array] = {}
+        self.cache_size = cache_size
+        self.cache: Optional[OrderedDict] = OrderedDict() if cache_size is not None else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # (release finalizer, process pool, workers) kept between parallel batches
+        self._parallel: Optional[Tuple[weakref.finalize, ProcessPoolExecutor, int]] = None
+
+        if engine == "csr":
+            self.index = CSRIndex.from_array(arr)
+        elif engine == "wavelet":
+            self.index = WaveletMatrix(arr)
+        else:
+            # Build index map: O(n). Positions are appended in increasing
+            # order, so every list is already sorted
+            for i, val in enumerate(arr):
+                if val not in self.index_map:
+                    self.index_map[val] = []
+                self.index_map[val].append(i)
+
+            if engine == "dynamic":
+                for val, indices in self.index_map.items():
+                    self.index_map[val] = SortedPositions(indices)
+
+        if heavy_threshold is not None:
+            self._build_heavy(heavy_threshold)
+
+    def _value_positions(self):
+        """Yield (value, sorted positions) for every distinct value."""
+        if self.index is not None:
+            index = self.index
+            for k in range(len(index.values)):
+                yield index.values[k], index.positions[index.offsets[k]:index.offsets[k + 1]]
+        else:
+            yield from self.index_map.items()
+
+    def _build_heavy(self, threshold: int) -> None:
+        # O(n) per heavy value: prefix[i] = occurrences in arr[0:i]
+        typecode = "i" if self.n < 2**31 else "q"
+        self.heavy = {}
+        for value, positions in self._value_positions():
+            if len(positions) < threshold:
+                continue
+            value = int(value) if np is not None and isinstance(value, np.integer) else value
+            prefix = array(typecode, bytes(array(typecode).itemsize * (self.n + 1)))
+            count, last = 0, 0
+            for pos in positions:
+                # prefix[last:pos + 1] all equal count: one C-level fill
+                prefix[last:pos + 1] = array(typecode, [count]) * (pos + 1 - last)
+                count += 1
+                last = pos + 1
+            prefix[last:] = array(typecode, [count]) * (self.n + 1 - last)
+            self.heavy[value] = prefix
+
+    def index_memory(self) -> Dict[str, int]:
+        """
+        Approximate bytes held by the light (bisect) and heavy (prefix)
+        structures, and by the array copy kept once the index is mutated.
+        """
+        heavy_bytes = sum(prefix.itemsize * len(prefix) for prefix in self.heavy.values())
+        if isinstance(self.index, WaveletMatrix):
+            light_bytes = self.index.memory_bytes()
+        elif self.index is not None:
+            index = self.index
+            light_bytes = 8 * (len(index.values) + len(index.offsets) + len(index.positions))
+        else:
+            # Per value: the list (or blocks) of pointers plus one int object per position
+            light_bytes = sys.getsizeof(self.index_map)
+            for indices in self.index_map.values():
+                if isinstance(indices, SortedPositions):
+                    light_bytes += sum(sys.getsizeof(block) for block in indices.blocks)
+                else:
+                    light_bytes += sys.getsizeof(indices)
+                light_bytes += 28 * len(indices)
+        return {
+            "light_bytes": light_bytes,
+            "heavy_bytes": heavy_bytes,
+            "heavy_values": len(self.heavy),
+            "arr_bytes": sys.getsizeof(self.arr) if self.arr is not None else 0,
+        }
+
+    def _add_position(self, value: int, i: int) -> None:
+        indices = self.index_map.get(value)
+        if indices is None:
+            self.index_map[value] = indices = SortedPositions() if self.engine == "dynamic" else []
+        if self.engine == "dynamic":
+            indices.add(i)
+        else:
+            # O(m) list shift; the dynamic engine avoids it
+            bisect.insort(indices, i)
+
+    def _remove_position(self, value: int, i: int) -> None:
+        indices = self.index_map[value]
+        if self.engine == "dynamic":
+            indices.remove(i)
+        else:
+            del indices[bisect.bisect_left(indices, i)]
+        if not len(indices):
+            del self.index_map[value]
+
+    def save(self, path: str) -> None:
+        """Write the index in CSRIndex's flat binary layout (integer values)."""
+        if isinstance(self.index, WaveletMatrix):
+            raise ValueError("The wavelet engine cannot be saved; use engine='csr'")
+        index = self.index if self.index is not None else CSRIndex.from_index_map(self.index_map)
+        index.save(path)
+
+    @classmethod
+    def load(cls, path: str) -> "RangeFrequencyQuery":
+        """Reopen a saved index as a memory-mapped csr engine: O(1) startup."""
+        rfq = cls([], engine="csr")
+        rfq.index = CSRIndex.load(path)
+        rfq.n = rfq.index.n
+        return rfq
+
+    def rebuild_heavy(self, threshold: Optional[int] = None) -> None:
+        """Recompute the heavy tables, optionally with a new threshold."""
+        if threshold is not None:
+            self.heavy_threshold = threshold
+        if self.heavy_threshold is not None:
+            self._build_heavy(self.heavy_threshold)
+
+    def _check_mutable(self) -> None:
+        if self.engine in ("csr", "wavelet"):
+            raise ValueError(f"The {self.engine} engine is static; use engine='dynamic' for updates")
+        if self.arr is None:
+            self._materialize_arr()
+        # Every mutation can change cached counts and the shared index copy
+        if self.cache:
+            self.cache.clear()
+        self._release_parallel()
+
+    def _materialize_arr(self) -> None:
+        # O(n) once, so updates know which value they replace; static
+        # workloads never pay for the copy
+        arr = [None] * self.n
+        for value, positions in self.index_map.items():
+            for i in positions:
+                arr[i] = value
+        self.arr = arr
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counters and current size of the result cache."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self.cache) if self.cache is not None else 0,
+            "max_size": self.cache_size or 0,
+        }
+
+    def clear_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.clear()
+        self.cache_hits = self.cache_misses = 0
+
+    def update(self, i: int, new_value: int) -> None:
+        """
+        Set arr[i] = new_value: O(log n) on the dynamic engine. A heavy
+        table would need O(n) to patch, so the two affected values drop
+        back to the bisect path until rebuild_heavy().
+        """
+        self._check_mutable()
+        if i < 0 or i >= self.n:
+            raise IndexError(f"Index {i} out of range")
+        old_value = self.arr[i]
+        if old_value == new_value:
+            return
+        self.heavy.pop(old_value, None)
+        self.heavy.pop(new_value, None)
+        self._remove_position(old_value, i)
+        self._add_position(new_value, i)
+        self.arr[i] = new_value
+
+    def append(self, value: int) -> None:
+        self._check_mutable()
+        # Heavy tables only grow at the end: O(h) for h heavy values
+        for heavy_value, prefix in self.heavy.items():
+            prefix.append(prefix[-1] + (heavy_value == value))
+        self._add_position(value, self.n)
+        self.arr.append(value)
+        self.n += 1
+
+    def pop(self) -> int:
+        self._check_mutable()
+        if self.n == 0:
+            raise IndexError("pop from empty array")
+        value = self.arr.pop()
+        for prefix in self.heavy.values():
+            prefix.pop()
+        self.n -= 1
+        self._remove_position(value, self.n)
+        return value
     
     def query(self, left: int, right: int, value: int) -> int:
-      
+        if self.cache is None:
+            return self._query(left, right, value)
+
+        # Cache hit: one dict lookup, no bisects
+        key = (left, right, value)
+        result = self.cache.get(key)
+        if result is not None:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+            return result
+        self.cache_misses += 1
+        result = self._query(left, right, value)
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    def _query(self, left: int, right: int, value: int) -> int:
+        # Heavy value: two prefix-table reads, O(1)
+        if self.heavy:
+            prefix = self.heavy.get(value)
+            if prefix is not None:
+                left, right = max(left, 0), min(right, self.n - 1)
+                return prefix[right + 1] - prefix[left] if left <= right else 0
+
+        if self.index is not None:
+            return self.index.query(left, right, value)
+
         # Value not in array: O(1)
         if value not in self.index_map:
             return 0
         
         indices = self.index_map[value]
+        if self.engine == "dynamic":
+            return indices.count_range(left, right)
         
         # Binary search for left boundary: O(log m)
         left_pos = bisect.bisect_left(indices, left)
@@ -41,9 +583,146 @@ class RangeFrequencyQuery:
         
         return right_pos - left_pos + 1
     
-    def batch_query(self, queries: List[Tuple[int, int, int]]) -> List[int]:
+    def batch_query(self, queries: List[Tuple[int, int, int]], offline: Optional[bool] = None,
+                    workers: int = 1, chunk_size: Optional[int] = None) -> List[int]:
+        """
+        offline=None picks the offline sweep for batches of at least
+        OFFLINE_BATCH_THRESHOLD queries on engines that keep sorted position
+        arrays (map, and csr without NumPy); True/False forces the choice.
+
+        workers > 1 fans batches of at least PARALLEL_BATCH_THRESHOLD
+        queries out to a process pool sharing one copy of the index
+        (integer values; not available for the wavelet engine). The pool
+        and shared copy are reused until close() or the next update.
+        """
+        if workers > 1 and len(queries) >= PARALLEL_BATCH_THRESHOLD and self.engine != "wavelet":
+            return self._parallel_batch(queries, workers, chunk_size)
+
+        sweepable = self.engine == "map" or (self.engine == "csr" and np is None)
+        if offline is None:
+            offline = len(queries) >= OFFLINE_BATCH_THRESHOLD
+        if offline and sweepable:
+            return self._offline_batch(queries)
+        if self.index is not None:
+            return self.index.batch_query(queries)
         return [self.query(left, right, value) for left, right, value in queries]
 
+    def _parallel_batch(self, queries: List[Tuple[int, int, int]], workers: int,
+                        chunk_size: Optional[int] = None) -> List[int]:
+        """Map query chunks over the shared-index pool; results come back in order."""
+        pool = self._parallel_pool(workers)
+
+        # About four chunks per worker balances load without flooding the pool
+        if chunk_size is None:
+            chunk_size = max(1000, -(-len(queries) // (workers * 4)))
+        chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+
+        results: List[int] = []
+        for part in pool.map(_answer_chunk, chunks):
+            results.extend(part)
+        return results
+
+    def _parallel_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Copy the index into one shared memory block in CSR layout and start
+        a pool whose workers attach to it once. Both are kept until close()
+        or the next update, so later batches reuse them.
+        """
+        if self._parallel is not None:
+            if self._parallel[2] == workers:
+                return self._parallel[1]
+            self._release_parallel()
+
+        index = self.index if self.index is not None else CSRIndex.from_index_map(self.index_map)
+        k, n = len(index.values), index.n
+        with_keys = np is not None
+        sources = [index.values, index.offsets, index.positions]
+        if with_keys and len(index.values):
+            sources.append(index._sorted_keys())
+        else:
+            with_keys = False
+
+        size = 8 * sum(len(source) for source in sources)
+        block = shared_memory.SharedMemory(create=True, size=max(size, 8))
+        try:
+            targets = _shared_sections(block.buf, k, n, with_keys)
+            for target, source in zip(targets, sources):
+                if np is not None:
+                    target[:] = source
+                else:
+                    target[:] = array("q", source)
+            del targets, target
+
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_index,
+                                       initargs=(block.name, k, n, with_keys))
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+        # Also frees the block if the instance is dropped without close()
+        self._parallel = (weakref.finalize(self, _release_shared, block, pool), pool, workers)
+        return pool
+
+    def _release_parallel(self) -> None:
+        if self._parallel is not None:
+            release = self._parallel[0]
+            self._parallel = None
+            release()
+
+    def close(self) -> None:
+        """Stop the parallel batch pool, free its shared index and unmap a loaded index."""
+        self._release_parallel()
+        if isinstance(self.index, CSRIndex):
+            self.index.close()
+
+    def _sorted_positions(self, value: int):
+        """(positions, lo, hi): the value's sorted positions are positions[lo:hi]."""
+        if self.index is None:
+            indices = self.index_map.get(value)
+            return None if indices is None else (indices, 0, len(indices))
+        index = self.index
+        k = bisect.bisect_left(index.values, value)
+        if k == len(index.values) or index.values[k] != value:
+            return None
+        return index.positions, int(index.offsets[k]), int(index.offsets[k + 1])
+
+    def _offline_batch(self, queries: List[Tuple[int, int, int]]) -> List[int]:
+        """
+        Group queries by value (one pass), order each group by left
+        endpoint and answer it with a run of bisects over that value's
+        position slice only, so consecutive searches touch neighbouring
+        memory. The bisects run through map(), keeping the per-query work
+        in C. Results come back in the original order.
+        """
+        results = [0] * len(queries)
+        groups: Dict[int, List[int]] = {}
+        for qi, (left, right, value) in enumerate(queries):
+            if left <= right:
+                groups.setdefault(value, []).append(qi)
+        lefts = [query[0] for query in queries]
+
+        for value, members in groups.items():
+            if value in self.heavy:
+                for qi in members:
+                    results[qi] = self._query(*queries[qi])
+                continue
+            located = self._sorted_positions(value)
+            if located is None:
+                continue
+            positions, lo, hi = located
+
+            members.sort(key=lefts.__getitem__)
+            group_lefts = [lefts[qi] for qi in members]
+            group_rights = [queries[qi][1] for qi in members]
+            counts = map(
+                operator.sub,
+                map(bisect.bisect_right, repeat(positions), group_rights, repeat(lo), repeat(hi)),
+                map(bisect.bisect_left, repeat(positions), group_lefts, repeat(lo), repeat(hi)),
+            )
+            for qi, count in zip(members, counts):
+                results[qi] = count
+        return results
+
 def test_range_frequency():
     print("=" * 60)
     print("RANGE FREQUENCY QUERY TEST SUITE")
@@ -130,23 +809,149 @@ def test_range_frequency():
         all_passed = False
     
     # Test Case 7: Large array test (performance)
-    print("\nTest 7: Large array performance test")
+    print("\nTest 7: Large array against brute force")
+    import random
+    rng7 = random.Random(7)
     arr7 = list(range(10000)) + [42] * 100  # 10,100 elements
+    rng7.shuffle(arr7)
     rfq7 = RangeFrequencyQuery(arr7)
+    mismatches7 = 0
+    for _ in range(200):
+        left, right = sorted((rng7.randrange(len(arr7)), rng7.randrange(len(arr7))))
+        value = rng7.choice((42, arr7[rng7.randrange(len(arr7))], -1))
+        if rfq7.query(left, right, value) != arr7[left:right + 1].count(value):
+            mismatches7 += 1
     
-    import time
-    start = time.time()
-    for _ in range(1000):
-        rfq7.query(5000, 9000, 42)
-    elapsed = time.time() - start
+    # Timing lives in range_frequency_test.py; here only correctness counts
+    test_cases.append(("Large array", "10k", "multiple", mismatches7, 0))
+    if mismatches7 == 0:
+        print("✓ PASS: 200 random queries on 10k array match brute force")
+    else:
+        print(f"✗ FAIL: {mismatches7} of 200 queries disagree with brute force")
+        all_passed = False
     
-    # Should complete quickly (demonstrates O(log n) queries)
-    if elapsed < 0.1:  # Less than 100ms for 1000 queries
-        print(f"✓ PASS: 1000 queries on 10k array in {elapsed:.3f}s (< 0.1s)")
-        performance_ok = True
+    # Test Case 8: CSR engine agrees with the index map
+    print("\nTest 8: CSR engine matches map engine")
+    arr8 = [3, 1, 3, 3, 2, 1, 3, 2]
+    queries8 = [(0, 7, 3), (1, 5, 1), (2, 2, 3), (4, 7, 2), (0, 7, 9), (5, 3, 3)]
+    expected8 = RangeFrequencyQuery(arr8).batch_query(queries8)
+    results8 = RangeFrequencyQuery(arr8, engine="csr").batch_query(queries8)
+    test_cases.append(("CSR engine", arr8, queries8, results8, expected8))
+    if results8 == expected8:
+        print(f"✓ PASS: csr batch_query={results8}")
     else:
-        print(f"⚠ WARNING: Slow performance: {elapsed:.3f}s")
-        performance_ok = False
+        print(f"✗ FAIL: Expected {expected8}, got {results8}")
+        all_passed = False
+    
+    # Test Case 9: Point updates, appends and pops
+    print("\nTest 9: Updates on the dynamic engine")
+    arr9 = [1, 2, 1, 3, 1]
+    rfq9 = RangeFrequencyQuery(arr9, engine="dynamic")
+    rfq9.update(1, 1)      # [1, 1, 1, 3, 1]
+    rfq9.update(0, 3)      # [3, 1, 1, 3, 1]
+    rfq9.append(1)         # [3, 1, 1, 3, 1, 1]
+    rfq9.pop()             # [3, 1, 1, 3, 1]
+    queries9 = [(0, 4, 1), (0, 4, 3), (0, 4, 2)]
+    results9 = rfq9.batch_query(queries9)
+    expected9 = [3, 2, 0]
+    test_cases.append(("Updates", arr9, queries9, results9, expected9))
+    if results9 == expected9:
+        print(f"✓ PASS: after updates, results={results9}")
+    else:
+        print(f"✗ FAIL: Expected {expected9}, got {results9}")
+        all_passed = False
+    
+    # Test Case 10: Save and memory-mapped load
+    print("\nTest 10: Save and load")
+    import os
+    import tempfile
+    path10 = os.path.join(tempfile.mkdtemp(), "index.rfq")
+    arr10 = [4, 2, 4, 4, 1, 2]
+    queries10 = [(0, 5, 4), (1, 5, 2), (0, 3, 1), (0, 5, 7)]
+    RangeFrequencyQuery(arr10).save(path10)
+    rfq10 = RangeFrequencyQuery.load(path10)
+    results10 = rfq10.batch_query(queries10)
+    expected10 = [3, 2, 0, 0]
+    rfq10.index.close()
+    os.remove(path10)
+    test_cases.append(("Save/load", arr10, queries10, results10, expected10))
+    if results10 == expected10:
+        print(f"✓ PASS: loaded index results={results10}")
+    else:
+        print(f"✗ FAIL: Expected {expected10}, got {results10}")
+        all_passed = False
+    
+    # Test Case 11: Heavy values answered from prefix tables
+    print("\nTest 11: Heavy-value prefix tables")
+    arr11 = [7, 1, 7, 7, 2, 7, 1, 7]
+    rfq11 = RangeFrequencyQuery(arr11, heavy_threshold=3)
+    queries11 = [(0, 7, 7), (2, 4, 7), (0, 7, 1), (5, 3, 7)]
+    results11 = rfq11.batch_query(queries11)
+    expected11 = [5, 2, 2, 0]
+    memory11 = rfq11.index_memory()
+    test_cases.append(("Heavy values", arr11, queries11, results11, expected11))
+    if results11 == expected11 and memory11["heavy_values"] == 1:
+        print(f"✓ PASS: results={results11}, heavy table bytes={memory11['heavy_bytes']}")
+    else:
+        print(f"✗ FAIL: Expected {expected11}, got {results11}")
+        all_passed = False
+    
+    # Test Case 12: Wavelet engine, plus range rank and quantile
+    print("\nTest 12: Wavelet engine")
+    arr12 = [5, 1, 4, 1, 5, 9, 2, 6]
+    rfq12 = RangeFrequencyQuery(arr12, engine="wavelet")
+    queries12 = [(0, 7, 5), (1, 3, 1), (0, 7, 3)]
+    results12 = rfq12.batch_query(queries12) + [rfq12.index.count_less(0, 7, 5), rfq12.index.kth_smallest(2, 6, 2)]
+    expected12 = [2, 2, 0, 4, 4]
+    test_cases.append(("Wavelet engine", arr12, queries12, results12, expected12))
+    if results12 == expected12:
+        print(f"✓ PASS: query/count_less/kth_smallest={results12}")
+    else:
+        print(f"✗ FAIL: Expected {expected12}, got {results12}")
+        all_passed = False
+    
+    # Test Case 13: Offline sweep returns results in query order
+    print("\nTest 13: Offline batch sweep")
+    arr13 = [2, 1, 2, 2, 1, 3, 2, 1]
+    rfq13 = RangeFrequencyQuery(arr13)
+    queries13 = [(0, 7, 2), (3, 7, 1), (0, 2, 3), (2, 6, 2), (6, 1, 2), (0, 7, 9)]
+    expected13 = rfq13.batch_query(queries13, offline=False)
+    results13 = rfq13.batch_query(queries13, offline=True)
+    test_cases.append(("Offline batch", arr13, queries13, results13, expected13))
+    if results13 == expected13:
+        print(f"✓ PASS: offline results={results13}")
+    else:
+        print(f"✗ FAIL: Expected {expected13}, got {results13}")
+        all_passed = False
+    
+    # Test 14: Streaming reader splits tokens across read blocks
+    print("\nTest 14: Streaming integer reader")
+    import io
+    results14 = list(read_ints(io.StringIO("12 345  6\n78 -9"), chunk_bytes=3))
+    expected14 = [12, 345, 6, 78, -9]
+    test_cases.append(("Streaming read", "io", "multiple", results14, expected14))
+    if results14 == expected14:
+        print(f"✓ PASS: values={results14}")
+    else:
+        print(f"✗ FAIL: Expected {expected14}, got {results14}")
+        all_passed = False
+    
+    # Test 15: LRU result cache with invalidation on update
+    print("\nTest 15: LRU result cache")
+    rfq15 = RangeFrequencyQuery([1, 2, 1, 3, 1], engine="dynamic", cache_size=2)
+    results15 = [rfq15.query(0, 4, 1), rfq15.query(0, 4, 1), rfq15.query(0, 2, 2), rfq15.query(1, 3, 3),
+                 rfq15.query(0, 4, 1)]
+    rfq15.update(1, 1)
+    results15.append(rfq15.query(0, 4, 1))
+    info15 = rfq15.cache_info()
+    results15 += [info15["hits"], info15["misses"], info15["size"]]
+    expected15 = [3, 3, 1, 1, 3, 4, 1, 5, 1]
+    test_cases.append(("LRU cache", [1, 2, 1, 3, 1], "multiple", results15, expected15))
+    if results15 == expected15:
+        print(f"✓ PASS: results and hits/misses/size={results15}")
+    else:
+        print(f"✗ FAIL: Expected {expected15}, got {results15}")
+        all_passed = False
     
     print("\n" + "=" * 60)
     if all_passed:
@@ -167,15 +972,125 @@ def test_range_frequency():
             q_str = "multiple"
         print(f"{name:<20} {str(result):<10} {str(expected):<10} {status:<10}")
     
-    return all_passed and performance_ok
+    return all_passed
+
+
+def read_ints(stream, chunk_bytes: int = 1 << 20):
+    """Yield whitespace-separated integers from a text stream, one block at a time."""
+    carry = ""
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            break
+        tokens = (carry + block).split()
+        # A token touching the block end may continue in the next block
+        carry = tokens.pop() if tokens and not block[-1].isspace() else ""
+        yield from map(int, tokens)
+    if carry:
+        yield int(carry)
+
+
+def open_stream(path: str, mode: str):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, buffering=1 << 20)
+
+
+def run_stream(array_path: str, queries_path: str, output_path: str = "-",
+               engine: str = "map", chunk_size: int = PARALLEL_BATCH_THRESHOLD, workers: int = 1) -> int:
+    """
+    Non-interactive mode: read the array, then answer the query file
+    `chunk_size` lines at a time through batch_query, writing one result
+    per line. Throughput goes to stderr so stdout stays machine-readable.
+    With workers > 1 every full chunk reuses one pool and shared index.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    start = time.perf_counter()
+    stream = open_stream(array_path, "r")
+    try:
+        arr = list(read_ints(stream))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    rfq = RangeFrequencyQuery(arr, engine=engine)
+    build_time = time.perf_counter() - start
+
+    total = lines_read = 0
+    start = time.perf_counter()
+    source = open_stream(queries_path, "r")
+    out = open_stream(output_path, "w")
+    try:
+        while True:
+            lines = list(islice(source, chunk_size))
+            if not lines:
+                break
+            chunk = []
+            for offset, line in enumerate(lines, lines_read + 1):
+                fields = line.split()
+                if not fields:
+                    continue
+                if len(fields) != 3:
+                    raise ValueError(f"Invalid query at line {offset}: {line.strip()!r}")
+                chunk.append((int(fields[0]), int(fields[1]), int(fields[2])))
+            results = rfq.batch_query(chunk, workers=workers)
+            if results:
+                out.write("\n".join(map(str, results)))
+                out.write("\n")
+            lines_read += len(lines)
+            total += len(chunk)
+    finally:
+        rfq.close()
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+    elapsed = time.perf_counter() - start
+
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    print(f"Built {engine} index over {len(arr):,} elements in {build_time:.3f}s", file=sys.stderr)
+    print(f"Answered {total:,} queries in {elapsed:.3f}s ({rate:,.0f} queries/sec)", file=sys.stderr)
+    return total
+
 
 def main():
     """Main function for standalone execution."""
+    parser = argparse.ArgumentParser(description="Range Frequency Query - O(n log n) Algorithm")
+    parser.add_argument("--test", action="store_true", help="run the test suite")
+    parser.add_argument("--array", metavar="PATH", help="array file of integers ('-' for stdin)")
+    parser.add_argument("--queries", metavar="PATH", help="query file, one 'left right value' per line ('-' for stdin)")
+    parser.add_argument("--output", metavar="PATH", default="-", help="result file (default stdout)")
+    parser.add_argument("--engine", choices=RangeFrequencyQuery.ENGINES, default="map")
+    parser.add_argument("--chunk-size", type=int, default=PARALLEL_BATCH_THRESHOLD,
+                        help=f"queries per batch (default and minimum with --workers: {PARALLEL_BATCH_THRESHOLD})")
+    parser.add_argument("--workers", type=int, default=1, help="processes for large batches")
+    args = parser.parse_args()
+
+    # Streaming mode: both inputs given as files or stdin
+    if args.array or args.queries:
+        if not (args.array and args.queries):
+            parser.error("--array and --queries must be given together")
+        if args.array == "-" and args.queries == "-":
+            parser.error("only one of --array and --queries can read stdin")
+        if args.chunk_size < 1:
+            parser.error("--chunk-size must be at least 1")
+        # Smaller chunks never reach the process pool
+        if args.workers > 1 and args.chunk_size < PARALLEL_BATCH_THRESHOLD:
+            parser.error(f"--chunk-size must be at least {PARALLEL_BATCH_THRESHOLD} with --workers")
+        try:
+            run_stream(args.array, args.queries, args.output, args.engine, args.chunk_size, args.workers)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     print("Range Frequency Query - O(n log n) Algorithm")
     print("=" * 50)
     
     # Interactive mode or test mode
-    if len(sys.argv) > 1 and sys.argv[1] == "--test":
+    if args.test:
         test_range_frequency()
         return
     
@@ -1,40 +1,211 @@
-import time
+"""
+Range Frequency Benchmark Suite (Q2a)
+Builds RangeFrequencyQuery for every engine over several array sizes and
+value distributions, then reports build time, index memory, single-query
+latency percentiles and batch throughput, optionally as JSON so engines
+can be compared head to head.
+
+Usage: python range_frequency_test.py [--sizes N ...] [--engines E ...] [--json PATH]
+pytest only collects the small smoke test at the bottom.
+"""
+
+import argparse
+import json
+import platform
 import random
-import bisect
-
-def test_sorting_only():
-    """Test only the sorting part to verify O(n log n)"""
-    
-    sizes = [10000, 20000, 40000, 80000, 160000]
-    
-    print("Testing SORTING ONLY (to verify O(n log n))")
-    print("-" * 60)
-    print(f"{'Size':<10} {'Time (s)':<12} {'Ratio':<10} {'Expected':<10}")
-    print("-" * 60)
-    
-    prev_time = None
-    
-    for size in sizes:
-        index_map = {}
-        for i in range(size):
-            val = i  # All distinct values
-            if val not in index_map:
-                index_map[val] = []
-            index_map[val].append(i)
-        
-        start = time.perf_counter()
-        for val in index_map:
-            index_map[val].sort()  
-        elapsed = time.perf_counter() - start
-        
-        if prev_time is not None:
-            ratio = elapsed / prev_time
-            expected = 2.15  # When doubling size, O(n log n) ratio is ~2.15x
-            status = "✓" if 1.8 <= ratio <= 2.4 else "✗"
-            print(f"{size:<10} {elapsed:.6f}    {ratio:.3f}x     {expected:.3f}x   {status}")
+import statistics
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from range_frequency import RangeFrequencyQuery
+
+DISTRIBUTIONS = ("uniform", "zipf", "few-distinct", "all-distinct")
+
+
+def make_array(distribution, size, seed):
+    """Seeded integer array; NumPy is only used to make 10M-element arrays fast."""
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        if distribution == "uniform":
+            arr = rng.integers(0, 1000, size)
+        elif distribution == "zipf":
+            arr = rng.zipf(1.3, size) - 1
+        elif distribution == "few-distinct":
+            arr = rng.integers(0, 8, size)
         else:
-            print(f"{size:<10} {elapsed:.6f}    -          -         -")
-        
-        prev_time = elapsed
+            arr = rng.permutation(size)
+        return arr.tolist()
+
+    rng = random.Random(seed)
+    if distribution == "uniform":
+        return [rng.randrange(1000) for _ in range(size)]
+    if distribution == "zipf":
+        # Inverse transform over 1/k^1.3 weights, truncated at size distinct values
+        weights = [1 / (k ** 1.3) for k in range(1, size + 1)]
+        return rng.choices(range(size), weights=weights, k=size)
+    if distribution == "few-distinct":
+        return [rng.randrange(8) for _ in range(size)]
+    arr = list(range(size))
+    rng.shuffle(arr)
+    return arr
+
+
+def make_queries(arr, count, seed):
+    """Random ranges; three quarters ask for a value present in the array."""
+    rng = random.Random(seed)
+    size = len(arr)
+    queries = []
+    for _ in range(count):
+        left, right = sorted((rng.randrange(size), rng.randrange(size)))
+        value = arr[rng.randrange(size)] if rng.random() < 0.75 else -1 - rng.randrange(1000)
+        queries.append((left, right, value))
+    return queries
+
+
+def percentiles(samples):
+    """Median, p95, p99 (nearest rank), min and mean of a list of seconds."""
+    ordered = sorted(samples)
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))]
+
+    return {
+        "median_s": statistics.median(ordered),
+        "p95_s": rank(95),
+        "p99_s": rank(99),
+        "min_s": ordered[0],
+        "mean_s": statistics.fmean(ordered),
+        "samples": len(ordered),
+    }
+
+
+def measure_build(arr, engine, trials):
+    times = []
+    rfq = None
+    for _ in range(trials):
+        rfq = None
+        start = time.perf_counter()
+        rfq = RangeFrequencyQuery(arr, engine=engine)
+        times.append(time.perf_counter() - start)
+    return rfq, percentiles(times)
+
+
+def measure_single(rfq, queries):
+    # Per-call timing includes ~100ns of perf_counter overhead
+    query = rfq.query
+    clock = time.perf_counter
+    times = []
+    for left, right, value in queries:
+        start = clock()
+        query(left, right, value)
+        times.append(clock() - start)
+    return percentiles(times)
+
+
+def measure_batch(rfq, queries, trials):
+    times = []
+    results = None
+    for _ in range(trials):
+        start = time.perf_counter()
+        results = rfq.batch_query(queries)
+        times.append(time.perf_counter() - start)
+    result = percentiles(times)
+    result["queries_per_s"] = len(queries) / result["median_s"] if result["median_s"] > 0 else float("inf")
+    # Engines must agree on the answers for a comparison to mean anything
+    result["checksum"] = sum(results)
+    return result
+
+
+def run(sizes, distributions, engines, single_queries, batch_queries, trials, seed):
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            arr = make_array(distribution, size, seed)
+            single = make_queries(arr, single_queries, seed + 1)
+            batch = make_queries(arr, batch_queries, seed + 2)
+            distinct = len(set(arr))
+            for engine in engines:
+                print(f"[{size:>10,}] {distribution:<13} {engine}", file=sys.stderr)
+                # Builds at 10M take tens of seconds, so they get fewer trials
+                rfq, build = measure_build(arr, engine, max(1, trials if size <= 1000000 else trials // 3))
+                base = {"engine": engine, "size": size, "distribution": distribution, "distinct": distinct}
+                results.append({**base, "kind": "build", **build, **rfq.index_memory()})
+                results.append({**base, "kind": "single", **measure_single(rfq, single)})
+                results.append({**base, "kind": "batch", "batch_size": len(batch),
+                                **measure_batch(rfq, batch, trials)})
+                rfq = None
+    return results
+
+
+def print_report(results):
+    print("\n" + "=" * 104)
+    print("RANGE FREQUENCY BENCHMARK (median / p95 / p99)")
+    print("=" * 104)
+    print(f"{'Engine':<8} {'Size':>11} {'Distribution':<13} {'Case':<8} "
+          f"{'Median':>11} {'p95':>11} {'p99':>11} {'Index MB':>9} {'Kq/s':>10}")
+    print("-" * 104)
+    for r in results:
+        # Build and batch times in ms, single queries in us
+        scale, unit = (1e6, "us") if r["kind"] == "single" else (1e3, "ms")
+        memory = f"{(r['light_bytes'] + r['heavy_bytes'] + r['arr_bytes']) / 2**20:9.1f}" if r["kind"] == "build" else ""
+        rate = f"{r['queries_per_s'] / 1e3:10.1f}" if r["kind"] == "batch" else ""
+        print(f"{r['engine']:<8} {r['size']:>11,} {r['distribution']:<13} {r['kind']:<8} "
+              f"{r['median_s'] * scale:>9.2f}{unit} {r['p95_s'] * scale:>9.2f}{unit} "
+              f"{r['p99_s'] * scale:>9.2f}{unit} {memory:>9} {rate:>10}")
+    print("=" * 104)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RangeFrequencyQuery engines.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="array sizes (10000000 works but takes minutes per engine)")
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--engines", nargs="+", choices=RangeFrequencyQuery.ENGINES,
+                        default=list(RangeFrequencyQuery.ENGINES))
+    parser.add_argument("--single-queries", type=int, default=20000)
+    parser.add_argument("--batch-queries", type=int, default=100000)
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1019)
+    parser.add_argument("--json", metavar="PATH", help="write machine-readable results to PATH")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.distributions, args.engines, args.single_queries,
+                  args.batch_queries, args.trials, args.seed)
+    print_report(results)
+
+    if args.json:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": np.__version__ if np is not None else None,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "sizes": args.sizes,
+                "single_queries": args.single_queries,
+                "batch_queries": args.batch_queries,
+                "trials": args.trials,
+                "seed": args.seed,
+            },
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+def test_benchmark_smoke():
+    """Tiny run: every case is reported and all engines return the same answers."""
+    results = run([2000], DISTRIBUTIONS, RangeFrequencyQuery.ENGINES, 200, 500, 1, 7)
+    assert len(results) == 3 * len(DISTRIBUTIONS) * len(RangeFrequencyQuery.ENGINES)
+    for distribution in DISTRIBUTIONS:
+        checksums = {r["checksum"] for r in results if r["kind"] == "batch" and r["distribution"] == distribution}
+        assert len(checksums) == 1, (distribution, checksums)
+
 
-test_sorting_only()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Wavelet Matrix - O(log σ) range frequency, range rank and range quantile
+Values are compressed to codes 0..σ-1 and stored as ceil(log2 σ) levels of
+rank-indexed bit vectors, about 2 bits per element per level.
+"""
+
+import bisect
+import random
+import sys
+import time
+from array import array
+from typing import List, Sequence, Tuple
+
+
+# Maps 0/1 bytes to ASCII digits so int(..., 2) can pack 64 bits at once
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+class BitVector:
+    """Packed bits with a cumulative popcount per 64-bit word for O(1) rank."""
+
+    def __init__(self, bits: Sequence[int]):
+        self.n = len(bits)
+        self.words = array("Q")
+        self.ranks = array("q")
+        digits = bytes(bits).translate(_BIT_DIGITS)
+        ones = 0
+        for start in range(0, self.n, 64):
+            # Bit i of the word is position start + i
+            word = int(digits[start:start + 64][::-1], 2)
+            self.words.append(word)
+            self.ranks.append(ones)
+            ones += word.bit_count()
+        self.ranks.append(ones)
+        self.ones = ones
+
+    def rank1(self, i: int) -> int:
+        """Number of 1 bits in positions [0, i)."""
+        word, bit = i >> 6, i & 63
+        if bit == 0:
+            return self.ranks[word]
+        return self.ranks[word] + (self.words[word] & ((1 << bit) - 1)).bit_count()
+
+    def memory_bytes(self) -> int:
+        return self.words.itemsize * len(self.words) + self.ranks.itemsize * len(self.ranks)
+
+
+class WaveletMatrix:
+    """
+    Static wavelet matrix over an integer array. Ranges are inclusive
+    [left, right], as in RangeFrequencyQuery.
+
+    query(left, right, value):  occurrences of value       O(log σ)
+    count_less(left, right, x): elements < x               O(log σ)
+    kth_smallest(left, right, k): k-th smallest, 0-based   O(log σ)
+    """
+
+    def __init__(self, arr: List[int]):
+        self.n = len(arr)
+        self.alphabet = sorted(set(arr))
+        self.levels = max(1, (len(self.alphabet) - 1).bit_length())
+        code_of = {value: code for code, value in enumerate(self.alphabet)}
+        codes = [code_of[value] for value in arr]
+
+        # Build: one stable 0/1 partition per level, O(n log σ)
+        self.bit_vectors: List[BitVector] = []
+        self.zeros: List[int] = []
+        for level in range(self.levels):
+            shift = self.levels - 1 - level
+            bits = [(code >> shift) & 1 for code in codes]
+            vector = BitVector(bits)
+            self.bit_vectors.append(vector)
+            self.zeros.append(self.n - vector.ones)
+            codes = [c for c, b in zip(codes, bits) if not b] + [c for c, b in zip(codes, bits) if b]
+
+    def _clamp(self, left: int, right: int) -> Tuple[int, int]:
+        # Inclusive [left, right] -> half-open [lo, hi) inside the array
+        lo = min(max(left, 0), self.n)
+        return lo, max(min(right + 1, self.n), lo)
+
+    def query(self, left: int, right: int, value: int) -> int:
+        code = bisect.bisect_left(self.alphabet, value)
+        if code == len(self.alphabet) or self.alphabet[code] != value:
+            return 0
+        lo, hi = self._clamp(left, right)
+        for level, vector in enumerate(self.bit_vectors):
+            if (code >> (self.levels - 1 - level)) & 1:
+                lo = self.zeros[level] + vector.rank1(lo)
+                hi = self.zeros[level] + vector.rank1(hi)
+            else:
+                lo -= vector.rank1(lo)
+                hi -= vector.rank1(hi)
+        return hi - lo
+
+    def batch_query(self, queries: List[Tuple[int, int, int]]) -> List[int]:
+        return [self.query(left, right, value) for left, right, value in queries]
+
+    def count_less(self, left: int, right: int, x: int) -> int:
+        """Range rank: how many values in [left, right] are < x."""
+        bound = bisect.bisect_left(self.alphabet, x)
+        lo, hi = self._clamp(left, right)
+        if bound == 0 or lo >= hi:
+            return 0
+        if bound == len(self.alphabet):
+            return hi - lo
+
+        # Codes below `bound` branch to 0 where `bound` has its first extra 1
+        count = 0
+        for level, vector in enumerate(self.bit_vectors):
+            ones_lo, ones_hi = vector.rank1(lo), vector.rank1(hi)
+            if (bound >> (self.levels - 1 - level)) & 1:
+                count += (hi - lo) - (ones_hi - ones_lo)
+                lo = self.zeros[level] + ones_lo
+                hi = self.zeros[level] + ones_hi
+            else:
+                lo -= ones_lo
+                hi -= ones_hi
+        return count
+
+    def kth_smallest(self, left: int, right: int, k: int) -> int:
+        """Range quantile: the k-th smallest value in [left, right], k from 0."""
+        lo, hi = self._clamp(left, right)
+        if k < 0 or k >= hi - lo:
+            raise ValueError(f"k={k} outside range of {hi - lo} elements")
+        code = 0
+        for level, vector in enumerate(self.bit_vectors):
+            ones_lo, ones_hi = vector.rank1(lo), vector.rank1(hi)
+            zeros_in_range = (hi - lo) - (ones_hi - ones_lo)
+            if k < zeros_in_range:
+                lo -= ones_lo
+                hi -= ones_hi
+            else:
+                k -= zeros_in_range
+                code |= 1 << (self.levels - 1 - level)
+                lo = self.zeros[level] + ones_lo
+                hi = self.zeros[level] + ones_hi
+        return self.alphabet[code]
+
+    def memory_bytes(self) -> int:
+        """Bit vectors plus the value alphabet (list of int objects)."""
+        alphabet = sys.getsizeof(self.alphabet) + 28 * len(self.alphabet)
+        return alphabet + sum(vector.memory_bytes() for vector in self.bit_vectors)
+
+
+def benchmark_against_index_map(sizes=(10000, 100000, 1000000), sigma: int = 1000, num_queries: int = 20000):
+    """Compare build time, index memory and query latency with the index map."""
+    from range_frequency import RangeFrequencyQuery
+
+    print("=" * 78)
+    print("WAVELET MATRIX vs INDEX MAP")
+    print("=" * 78)
+    print(f"{'Size':>9} {'Engine':<9} {'Build (s)':>10} {'Index MB':>10} {'query (us)':>11} {'rank (us)':>10}")
+    print("-" * 78)
+    rng = random.Random(14)
+    for size in sizes:
+        arr = [rng.randrange(sigma) for _ in range(size)]
+        queries = []
+        for _ in range(num_queries):
+            left, right = sorted((rng.randrange(size), rng.randrange(size)))
+            queries.append((left, right, rng.randrange(sigma)))
+
+        start = time.perf_counter()
+        rfq = RangeFrequencyQuery(arr)
+        map_build = time.perf_counter() - start
+        start = time.perf_counter()
+        rfq.batch_query(queries)
+        map_query = (time.perf_counter() - start) / num_queries
+        map_bytes = rfq.index_memory()["light_bytes"]
+        print(f"{size:>9,} {'map':<9} {map_build:>10.3f} {map_bytes / 2**20:>10.2f} {map_query * 1e6:>11.2f} {'n/a':>10}")
+
+        start = time.perf_counter()
+        wm = WaveletMatrix(arr)
+        wm_build = time.perf_counter() - start
+        start = time.perf_counter()
+        wm.batch_query(queries)
+        wm_query = (time.perf_counter() - start) / num_queries
+        start = time.perf_counter()
+        for left, right, value in queries:
+            wm.count_less(left, right, value)
+        wm_rank = (time.perf_counter() - start) / num_queries
+        print(f"{size:>9,} {'wavelet':<9} {wm_build:>10.3f} {wm.memory_bytes() / 2**20:>10.2f} "
+              f"{wm_query * 1e6:>11.2f} {wm_rank * 1e6:>10.2f}")
+    print("=" * 78)
+
+
+def test_wavelet_matrix():
+    print("=" * 60)
+    print("WAVELET MATRIX TEST SUITE")
+    print("=" * 60)
+    arr = [5, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+    wm = WaveletMatrix(arr)
+    checks = [
+        ("query(0,9,5)", wm.query(0, 9, 5), 3),
+        ("query(2,7,1)", wm.query(2, 7, 1), 1),
+        ("query(0,9,7)", wm.query(0, 9, 7), 0),
+        ("query(6,3,5)", wm.query(6, 3, 5), 0),
+        ("count_less(0,9,5)", wm.count_less(0, 9, 5), 5),
+        ("count_less(2,6,6)", wm.count_less(2, 6, 6), 4),
+        ("kth_smallest(0,9,0)", wm.kth_smallest(0, 9, 0), 1),
+        ("kth_smallest(0,9,5)", wm.kth_smallest(0, 9, 5), 5),
+        ("kth_smallest(4,7,3)", wm.kth_smallest(4, 7, 3), 9),
+    ]
+    all_passed = True
+    for name, result, expected in checks:
+        if result == expected:
+            print(f"✓ PASS: {name}={result}")
+        else:
+            print(f"✗ FAIL: {name} expected {expected}, got {result}")
+            all_passed = False
+    print("ALL WAVELET TESTS PASSED ✓" if all_passed else "SOME TESTS FAILED ✗")
+    return all_passed
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark_against_index_map()
+    else:
+        test_wavelet_matrix()
+
+
+if __name__ == "__main__":
+    main()